@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 import click
 from rich.console import Console
@@ -146,9 +146,17 @@ def login(ctx: Context, browser: str, session_dir: Optional[Path]):
     "-f",
     "--format",
     "output_format",
-    type=click.Choice(["json", "sqlite", "csv", "llm"]),
+    type=click.Choice(["json", "sqlite", "csv", "parquet", "llm"]),
     default="json",
-    help="Output format: json (full), llm (optimized for LLM APIs), sqlite, csv",
+    help=(
+        "Output format: json (full), llm (optimized for LLM APIs), sqlite, csv, parquet"
+    ),
+)
+@click.option(
+    "--csv-engine",
+    type=click.Choice(["python", "pyarrow"]),
+    default="python",
+    help="CSV writer: python (csv module) or pyarrow (needs the arrow extra)",
 )
 @click.option(
     "--session-dir",
@@ -187,6 +195,7 @@ def scrape(
     skip_reactions: bool,
     output: Optional[Path],
     output_format: str,
+    csv_engine: Literal["python", "pyarrow"],
     session_dir: Optional[Path],
     headless: bool,
     browser: str,
@@ -290,11 +299,29 @@ def scrape(
         if not output:
             console.print("[red]CSV format requires --output file path[/red]")
             raise SystemExit(2)
-        export_to_csv(result, output)
+        export_to_csv(result, output, engine=csv_engine)
         if not ctx.quiet:
             comments_path = output.with_suffix(".comments.csv")
             console.print(f"[green]Posts exported to {output}[/green]")
             console.print(f"[green]Comments exported to {comments_path}[/green]")
+    elif output_format == "parquet":
+        from forage.exporter import export_to_parquet
+
+        if not output:
+            console.print("[red]Parquet format requires --output file path[/red]")
+            raise SystemExit(2)
+        try:
+            export_to_parquet(result, output)
+        except ImportError:
+            console.print(
+                "[red]Parquet format requires pyarrow: "
+                "pip install 'ForageFacebook[arrow]'[/red]"
+            )
+            raise SystemExit(2)
+        if not ctx.quiet:
+            comments_path = output.with_suffix(".comments.parquet")
+            console.print(f"[green]Posts exported to {output}[/green]")
+            console.print(f"[green]Comments exported to {comments_path}[/green]")
     elif output_format == "llm":
         from forage.exporter import export_to_llm, get_llm_json
 
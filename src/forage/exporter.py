@@ -5,10 +5,13 @@ from __future__ import annotations
 import csv
 import json
 import sqlite3
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal, TextIO
 
-from forage.models import Post, ScrapeResult
+from forage.models import Comment, Post, Reactions, ScrapeResult
 
 # Pain point keyword patterns for signal detection
 PAIN_PATTERNS: dict[str, list[str]] = {
@@ -106,6 +109,21 @@ def _detect_pain_signals(content: str | None) -> dict[str, Any]:
     }
 
 
+def _walk_comments(post: Post) -> Iterator[tuple[Comment, str | None]]:
+    """Yield (comment, parent_comment_id) for a post's comments and replies.
+
+    Iterative depth-first walk, so each reply follows its parent and deep
+    threads do not hit the recursion limit.
+    """
+    stack: deque[tuple[Comment, str | None]] = deque(
+        (comment, None) for comment in reversed(post.comments)
+    )
+    while stack:
+        comment, parent_id = stack.pop()
+        yield comment, parent_id
+        stack.extend((reply, comment.id) for reply in reversed(comment.replies))
+
+
 def _post_to_llm_format(post: Post, top_comments: int = 3) -> dict[str, Any]:
     """Convert a post to LLM-friendly format."""
     # Get top comments by reaction count
@@ -256,81 +274,331 @@ def get_llm_json(
     return json.dumps(output, indent=2, ensure_ascii=False)
 
 
-def export_to_csv(result: ScrapeResult, output_path: Path) -> None:
+# Large write buffer so big exports reach the disk in few write() calls
+_CSV_BUFFER_SIZE = 1 << 20
+
+# Column order must match the tuples yielded by _csv_post_rows/_csv_comment_rows
+_CSV_POST_HEADER = (
+    "post_id",
+    "author_name",
+    "author_profile_url",
+    "content",
+    "timestamp",
+    "reactions_total",
+    "comments_count",
+    "group_name",
+    "group_id",
+)
+_CSV_COMMENT_HEADER = (
+    "comment_id",
+    "post_id",
+    "parent_comment_id",
+    "author_name",
+    "author_profile_url",
+    "content",
+    "timestamp",
+    "reactions_total",
+)
+
+
+def _open_csv(path: Path) -> TextIO:
+    """Open a CSV file for writing through a _CSV_BUFFER_SIZE byte buffer.
+
+    Text is encoded in chunks as it is handed to the binary buffer, which only
+    reaches the OS once per _CSV_BUFFER_SIZE bytes.
+    """
+    return open(path, "w", newline="", encoding="utf-8", buffering=_CSV_BUFFER_SIZE)
+
+
+def _csv_timestamp(value: datetime | None) -> str:
+    return value.isoformat() if value else ""
+
+
+def _csv_post_rows(result: ScrapeResult) -> Iterator[tuple[Any, ...]]:
+    """Yield one posts-CSV row per post."""
+    group_name = result.group.name
+    group_id = result.group.id
+
+    for post in result.posts:
+        author = post.author
+        author_name, author_url = (
+            (author.name, author.profile_url) if author else ("", "")
+        )
+        reactions = post.reactions
+        yield (
+            post.id,
+            author_name,
+            author_url,
+            post.content or "",
+            _csv_timestamp(post.timestamp),
+            reactions.total if reactions else 0,
+            post.comments_count,
+            group_name,
+            group_id,
+        )
+
+
+def _csv_comment_rows(result: ScrapeResult) -> Iterator[tuple[Any, ...]]:
+    """Yield one comments-CSV row per comment or reply."""
+    for post in result.posts:
+        post_id = post.id
+        for comment, parent_id in _walk_comments(post):
+            author = comment.author
+            author_name, author_url = (
+                (author.name, author.profile_url) if author else ("", "")
+            )
+            reactions = comment.reactions
+            yield (
+                comment.id,
+                post_id,
+                parent_id or "",
+                author_name,
+                author_url,
+                comment.content or "",
+                _csv_timestamp(comment.timestamp),
+                reactions.total if reactions else 0,
+            )
+
+
+def _to_columns(
+    names: Sequence[str], rows: Iterable[tuple[Any, ...]]
+) -> dict[str, list[Any]]:
+    """Transpose row tuples into one list per column, keyed by column name.
+
+    Arrow builds each column from a flat list in one C pass, which is much
+    cheaper than converting row by row.
+    """
+    columns = list(zip(*rows)) or [() for _ in names]
+    return dict(zip(names, map(list, columns)))
+
+
+def _write_csv_pyarrow(result: ScrapeResult, output_path: Path) -> bool:
+    """Write both CSV files with pyarrow's native writer.
+
+    Returns False without writing anything if pyarrow is not installed.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return False
+
+    for path, header, rows in (
+        (output_path, _CSV_POST_HEADER, _csv_post_rows(result)),
+        (
+            output_path.with_suffix(".comments.csv"),
+            _CSV_COMMENT_HEADER,
+            _csv_comment_rows(result),
+        ),
+    ):
+        table = pa.table(_to_columns(header, rows))
+        pa_csv.write_csv(table, str(path))
+
+    return True
+
+
+def export_to_csv(
+    result: ScrapeResult,
+    output_path: Path,
+    *,
+    engine: Literal["python", "pyarrow"] = "python",
+) -> None:
     """Export scrape result to CSV files.
 
     Creates two files:
     - <output_path>: posts (one row per post)
     - <output_path>.comments.csv: comments (one row per comment)
+
+    engine="pyarrow" uses pyarrow's C++ CSV writer (``pip install
+    ForageFacebook[arrow]``) and falls back to the csv module if pyarrow is
+    not installed. Its output quotes every text field and uses LF line endings.
     """
-    # Posts CSV
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
+    if engine not in ("python", "pyarrow"):
+        raise ValueError(f"Unknown CSV engine: {engine!r}")
+    if engine == "pyarrow" and _write_csv_pyarrow(result, output_path):
+        return
+
+    _write_posts_csv(result, output_path)
+    # Comments go to a separate file
+    _write_comments_csv(result, output_path.with_suffix(".comments.csv"))
+
+
+def _write_posts_csv(result: ScrapeResult, path: Path) -> None:
+    """Write the posts CSV."""
+    with _open_csv(path) as f:
         writer = csv.writer(f)
-        writer.writerow(
-            [
-                "post_id",
-                "author_name",
-                "author_profile_url",
-                "content",
-                "timestamp",
-                "reactions_total",
-                "comments_count",
-                "group_name",
-                "group_id",
-            ]
-        )
+        writer.writerow(_CSV_POST_HEADER)
+        writer.writerows(_csv_post_rows(result))
 
-        for post in result.posts:
-            writer.writerow(
-                [
-                    post.id,
-                    post.author.name if post.author else "",
-                    post.author.profile_url if post.author else "",
-                    post.content or "",
-                    post.timestamp.isoformat() if post.timestamp else "",
-                    post.reactions.total if post.reactions else 0,
-                    post.comments_count,
-                    result.group.name,
-                    result.group.id,
-                ]
-            )
 
-    # Comments CSV (separate file)
-    comments_path = output_path.with_suffix(".comments.csv")
-    with open(comments_path, "w", newline="", encoding="utf-8") as f:
+def _write_comments_csv(result: ScrapeResult, path: Path) -> None:
+    """Write the comments CSV, replies included."""
+    with _open_csv(path) as f:
         writer = csv.writer(f)
-        writer.writerow(
-            [
-                "comment_id",
-                "post_id",
-                "parent_comment_id",
-                "author_name",
-                "author_profile_url",
-                "content",
-                "timestamp",
-                "reactions_total",
-            ]
+        writer.writerow(_CSV_COMMENT_HEADER)
+        writer.writerows(_csv_comment_rows(result))
+
+
+_ZERO_REACTIONS = (0, 0, 0, 0, 0, 0, 0)
+
+# SQLite schema and statements; each executemany prepares its statement once
+# for the whole batch.
+_SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS groups (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        url TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS posts (
+        id TEXT PRIMARY KEY,
+        group_id TEXT NOT NULL,
+        author_name TEXT,
+        author_profile_url TEXT,
+        content TEXT,
+        timestamp TEXT,
+        reactions_total INTEGER DEFAULT 0,
+        reactions_like INTEGER DEFAULT 0,
+        reactions_love INTEGER DEFAULT 0,
+        reactions_haha INTEGER DEFAULT 0,
+        reactions_wow INTEGER DEFAULT 0,
+        reactions_sad INTEGER DEFAULT 0,
+        reactions_angry INTEGER DEFAULT 0,
+        comments_count INTEGER DEFAULT 0,
+        scraped_at TEXT,
+        FOREIGN KEY (group_id) REFERENCES groups(id)
+    );
+
+    CREATE TABLE IF NOT EXISTS comments (
+        id TEXT PRIMARY KEY,
+        post_id TEXT NOT NULL,
+        parent_comment_id TEXT,
+        author_name TEXT,
+        author_profile_url TEXT,
+        content TEXT,
+        timestamp TEXT,
+        reactions_total INTEGER DEFAULT 0,
+        reactions_like INTEGER DEFAULT 0,
+        reactions_love INTEGER DEFAULT 0,
+        reactions_haha INTEGER DEFAULT 0,
+        reactions_wow INTEGER DEFAULT 0,
+        reactions_sad INTEGER DEFAULT 0,
+        reactions_angry INTEGER DEFAULT 0,
+        FOREIGN KEY (post_id) REFERENCES posts(id),
+        FOREIGN KEY (parent_comment_id) REFERENCES comments(id)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_posts_group ON posts(group_id);
+    CREATE INDEX IF NOT EXISTS idx_posts_timestamp ON posts(timestamp);
+    CREATE INDEX IF NOT EXISTS idx_comments_post ON comments(post_id);
+    CREATE INDEX IF NOT EXISTS idx_comments_parent ON comments(parent_comment_id);
+"""
+
+_INSERT_GROUP_SQL = """
+    INSERT OR REPLACE INTO groups (id, name, url)
+    VALUES (?, ?, ?)
+"""
+
+
+def _reaction_fields(reactions: Reactions | None) -> tuple[int, ...]:
+    """Return the reaction counts in reactions_* column order."""
+    if not reactions:
+        return _ZERO_REACTIONS
+    return (
+        reactions.total,
+        reactions.like,
+        reactions.love,
+        reactions.haha,
+        reactions.wow,
+        reactions.sad,
+        reactions.angry,
+    )
+
+
+# (name, SQLite type) of each posts/comments column, in the order the row
+# generators below yield them. The INSERT statements and the Parquet schema
+# are built from these; _SCHEMA_SQL must declare the same columns.
+_POST_COLUMNS = (
+    ("id", "TEXT"),
+    ("group_id", "TEXT"),
+    ("author_name", "TEXT"),
+    ("author_profile_url", "TEXT"),
+    ("content", "TEXT"),
+    ("timestamp", "TEXT"),
+    ("reactions_total", "INTEGER"),
+    ("reactions_like", "INTEGER"),
+    ("reactions_love", "INTEGER"),
+    ("reactions_haha", "INTEGER"),
+    ("reactions_wow", "INTEGER"),
+    ("reactions_sad", "INTEGER"),
+    ("reactions_angry", "INTEGER"),
+    ("comments_count", "INTEGER"),
+    ("scraped_at", "TEXT"),
+)
+_COMMENT_COLUMNS = (
+    ("id", "TEXT"),
+    ("post_id", "TEXT"),
+    ("parent_comment_id", "TEXT"),
+    ("author_name", "TEXT"),
+    ("author_profile_url", "TEXT"),
+    ("content", "TEXT"),
+    ("timestamp", "TEXT"),
+    ("reactions_total", "INTEGER"),
+    ("reactions_like", "INTEGER"),
+    ("reactions_love", "INTEGER"),
+    ("reactions_haha", "INTEGER"),
+    ("reactions_wow", "INTEGER"),
+    ("reactions_sad", "INTEGER"),
+    ("reactions_angry", "INTEGER"),
+)
+
+
+def _insert_sql(table: str, columns: tuple[tuple[str, str], ...]) -> str:
+    names = ", ".join(name for name, _ in columns)
+    params = ", ".join("?" * len(columns))
+    return f"INSERT OR REPLACE INTO {table} ({names}) VALUES ({params})"
+
+
+_INSERT_POST_SQL = _insert_sql("posts", _POST_COLUMNS)
+_INSERT_COMMENT_SQL = _insert_sql("comments", _COMMENT_COLUMNS)
+
+
+def _sqlite_post_rows(result: ScrapeResult) -> Iterator[tuple[Any, ...]]:
+    """Yield one posts-table row per post."""
+    group_id = result.group.id
+    scraped_at = result.scraped_at.isoformat() if result.scraped_at else None
+
+    for post in result.posts:
+        author = post.author
+        yield (
+            post.id,
+            group_id,
+            author.name if author else None,
+            author.profile_url if author else None,
+            post.content,
+            post.timestamp.isoformat() if post.timestamp else None,
+            *_reaction_fields(post.reactions),
+            post.comments_count,
+            scraped_at,
         )
 
-        def write_comment(comment, post_id, parent_id=""):
-            writer.writerow(
-                [
-                    comment.id,
-                    post_id,
-                    parent_id,
-                    comment.author.name if comment.author else "",
-                    comment.author.profile_url if comment.author else "",
-                    comment.content or "",
-                    comment.timestamp.isoformat() if comment.timestamp else "",
-                    comment.reactions.total if comment.reactions else 0,
-                ]
-            )
-            for reply in comment.replies:
-                write_comment(reply, post_id, parent_id=comment.id)
 
-        for post in result.posts:
-            for comment in post.comments:
-                write_comment(comment, post.id)
+def _sqlite_comment_rows(result: ScrapeResult) -> Iterator[tuple[Any, ...]]:
+    """Yield one comments-table row per comment or reply."""
+    for post in result.posts:
+        post_id = post.id
+        for comment, parent_id in _walk_comments(post):
+            author = comment.author
+            yield (
+                comment.id,
+                post_id,
+                parent_id,
+                author.name if author else None,
+                author.profile_url if author else None,
+                comment.content,
+                comment.timestamp.isoformat() if comment.timestamp else None,
+                *_reaction_fields(comment.reactions),
+            )
 
 
 def export_to_sqlite(result: ScrapeResult, db_path: Path) -> None:
@@ -339,141 +607,66 @@ def export_to_sqlite(result: ScrapeResult, db_path: Path) -> None:
     Creates tables for groups, posts, comments, and reactions.
     If the database exists, appends to it (upserts based on IDs).
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # Create tables
-    cursor.executescript("""
-        CREATE TABLE IF NOT EXISTS groups (
-            id TEXT PRIMARY KEY,
-            name TEXT NOT NULL,
-            url TEXT NOT NULL
-        );
-
-        CREATE TABLE IF NOT EXISTS posts (
-            id TEXT PRIMARY KEY,
-            group_id TEXT NOT NULL,
-            author_name TEXT,
-            author_profile_url TEXT,
-            content TEXT,
-            timestamp TEXT,
-            reactions_total INTEGER DEFAULT 0,
-            reactions_like INTEGER DEFAULT 0,
-            reactions_love INTEGER DEFAULT 0,
-            reactions_haha INTEGER DEFAULT 0,
-            reactions_wow INTEGER DEFAULT 0,
-            reactions_sad INTEGER DEFAULT 0,
-            reactions_angry INTEGER DEFAULT 0,
-            comments_count INTEGER DEFAULT 0,
-            scraped_at TEXT,
-            FOREIGN KEY (group_id) REFERENCES groups(id)
-        );
-
-        CREATE TABLE IF NOT EXISTS comments (
-            id TEXT PRIMARY KEY,
-            post_id TEXT NOT NULL,
-            parent_comment_id TEXT,
-            author_name TEXT,
-            author_profile_url TEXT,
-            content TEXT,
-            timestamp TEXT,
-            reactions_total INTEGER DEFAULT 0,
-            reactions_like INTEGER DEFAULT 0,
-            reactions_love INTEGER DEFAULT 0,
-            reactions_haha INTEGER DEFAULT 0,
-            reactions_wow INTEGER DEFAULT 0,
-            reactions_sad INTEGER DEFAULT 0,
-            reactions_angry INTEGER DEFAULT 0,
-            FOREIGN KEY (post_id) REFERENCES posts(id),
-            FOREIGN KEY (parent_comment_id) REFERENCES comments(id)
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_posts_group ON posts(group_id);
-        CREATE INDEX IF NOT EXISTS idx_posts_timestamp ON posts(timestamp);
-        CREATE INDEX IF NOT EXISTS idx_comments_post ON comments(post_id);
-        CREATE INDEX IF NOT EXISTS idx_comments_parent ON comments(parent_comment_id);
-    """)
-
-    # Insert group
-    cursor.execute(
-        """
-        INSERT OR REPLACE INTO groups (id, name, url)
-        VALUES (?, ?, ?)
-        """,
-        (result.group.id, result.group.name, result.group.url),
-    )
-
-    scraped_at_str = result.scraped_at.isoformat() if result.scraped_at else None
-
-    # Insert posts and comments
-    for post in result.posts:
-        timestamp_str = post.timestamp.isoformat() if post.timestamp else None
-
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO posts (
-                id, group_id, author_name, author_profile_url, content,
-                timestamp, reactions_total, reactions_like, reactions_love,
-                reactions_haha, reactions_wow, reactions_sad, reactions_angry,
-                comments_count, scraped_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                post.id,
-                result.group.id,
-                post.author.name if post.author else None,
-                post.author.profile_url if post.author else None,
-                post.content,
-                timestamp_str,
-                post.reactions.total if post.reactions else 0,
-                post.reactions.like if post.reactions else 0,
-                post.reactions.love if post.reactions else 0,
-                post.reactions.haha if post.reactions else 0,
-                post.reactions.wow if post.reactions else 0,
-                post.reactions.sad if post.reactions else 0,
-                post.reactions.angry if post.reactions else 0,
-                post.comments_count,
-                scraped_at_str,
-            ),
+    # Autocommit mode: the transaction below is managed explicitly
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        # WAL + NORMAL sync: one fsync per checkpoint instead of per commit
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Index builds and sorts stay in RAM; 64 MiB page cache for big exports
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+
+        # Create tables
+        conn.executescript(_SCHEMA_SQL)
+
+        # Single transaction for the whole export. IMMEDIATE takes the write
+        # lock up front instead of upgrading a read lock mid-transaction.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            group = result.group
+            conn.execute(_INSERT_GROUP_SQL, (group.id, group.name, group.url))
+            # Rows are streamed straight from the models into executemany
+            conn.executemany(_INSERT_POST_SQL, _sqlite_post_rows(result))
+            conn.executemany(_INSERT_COMMENT_SQL, _sqlite_comment_rows(result))
+        except BaseException:
+            # SQLite has already rolled back on some errors (SQLITE_FULL,
+            # OR ROLLBACK conflicts, ...); a second ROLLBACK would mask them
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+
+def export_to_parquet(result: ScrapeResult, output_path: Path) -> None:
+    """Export scrape result to ZSTD-compressed Parquet files.
+
+    Creates two files with the same columns as the SQLite tables:
+    - <output_path>: posts
+    - <output_path>.comments.parquet: comments
+
+    Requires pyarrow (``pip install ForageFacebook[arrow]``).
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    arrow_types = {"TEXT": pa.string(), "INTEGER": pa.int64()}
+    for path, columns, rows in (
+        (output_path, _POST_COLUMNS, _sqlite_post_rows(result)),
+        (
+            output_path.with_suffix(".comments.parquet"),
+            _COMMENT_COLUMNS,
+            _sqlite_comment_rows(result),
+        ),
+    ):
+        # Fixed types, so empty or all-null columns still get a stable schema
+        schema = pa.schema(
+            [(name, arrow_types[sql_type]) for name, sql_type in columns]
         )
-
-        # Insert comments recursively
-        def insert_comment(comment, parent_id=None):
-            comment_timestamp = (
-                comment.timestamp.isoformat() if comment.timestamp else None
-            )
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO comments (
-                    id, post_id, parent_comment_id, author_name, author_profile_url,
-                    content, timestamp, reactions_total, reactions_like, reactions_love,
-                    reactions_haha, reactions_wow, reactions_sad, reactions_angry
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    comment.id,
-                    post.id,
-                    parent_id,
-                    comment.author.name if comment.author else None,
-                    comment.author.profile_url if comment.author else None,
-                    comment.content,
-                    comment_timestamp,
-                    comment.reactions.total if comment.reactions else 0,
-                    comment.reactions.like if comment.reactions else 0,
-                    comment.reactions.love if comment.reactions else 0,
-                    comment.reactions.haha if comment.reactions else 0,
-                    comment.reactions.wow if comment.reactions else 0,
-                    comment.reactions.sad if comment.reactions else 0,
-                    comment.reactions.angry if comment.reactions else 0,
-                ),
-            )
-
-            # Insert nested replies
-            for reply in comment.replies:
-                insert_comment(reply, parent_id=comment.id)
-
-        for comment in post.comments:
-            insert_comment(comment)
-
-    conn.commit()
-    conn.close()
+        table = pa.table(_to_columns(schema.names, rows), schema=schema)
+        pq.write_table(table, str(path), compression="zstd")
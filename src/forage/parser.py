@@ -3,15 +3,150 @@
 from __future__ import annotations
 
 import hashlib
+import heapq
 import re
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Optional
 from urllib.parse import parse_qs, urlparse
 
 from playwright.sync_api import ElementHandle, Page
 
 from forage.models import Author, Comment, Post, Reactions
 
+# Patterns are compiled once at import; the parsers run per element.
+_RE_COMPACT_NUMBER = re.compile(r"(\d+(?:\.\d+)?)\s*([kKmM])\b")
+_RE_NUMBER = re.compile(r"(\d+)")
+
+_RE_REL_MINUTES = re.compile(r"(\d+)\s*(?:m|min|mins|minute|minutes)\b")
+_RE_REL_HOURS = re.compile(r"(\d+)\s*(?:h|hr|hrs|hour|hours)\b")
+_RE_REL_DAYS = re.compile(r"(\d+)\s*(?:d|day|days)\b")
+_RE_REL_WEEKS = re.compile(r"(\d+)\s*(?:w|wk|wks|week|weeks)\b")
+_RE_REL_MONTHS = re.compile(r"(\d+)\s*(?:mo|mos|month|months)\b")
+_RE_REL_YEARS = re.compile(r"(\d+)\s*(?:y|yr|yrs|year|years)\b")
+
+_RELATIVE_PATTERNS: tuple[tuple[re.Pattern[str], Callable[[int], timedelta]], ...] = (
+    (_RE_REL_MINUTES, lambda n: timedelta(minutes=n)),
+    (_RE_REL_HOURS, lambda n: timedelta(hours=n)),
+    (_RE_REL_DAYS, lambda n: timedelta(days=n)),
+    (_RE_REL_WEEKS, lambda n: timedelta(weeks=n)),
+    # Approximate long ranges; most scrapes target recent posts.
+    (_RE_REL_MONTHS, lambda n: timedelta(days=30 * n)),
+    (_RE_REL_YEARS, lambda n: timedelta(days=365 * n)),
+)
+
+_RE_YESTERDAY_TIME = re.compile(
+    r"yesterday\s*(?:at\s*)?(\d{1,2}(?::\d{2})?\s*[APap][Mm])"
+)
+_RE_AM_PM_SUFFIX = re.compile(r"\s*(AM|PM)$")
+_RE_MONTH_DAY_AT = re.compile(
+    r"^([A-Za-z]+\.?)\s+(\d{1,2})\s+at\s+(.+)$", re.IGNORECASE
+)
+_RE_MONTH_DAY = re.compile(r"^([A-Za-z]+\.?)\s+(\d{1,2})$", re.IGNORECASE)
+
+_MONTH_FIRST_DATE_FORMATS = (
+    "%B %d, %Y at %I:%M %p",
+    "%b %d, %Y at %I:%M %p",
+    "%B %d, %Y",
+    "%b %d, %Y",
+)
+_DAY_FIRST_DATE_FORMATS = ("%d %b %Y", "%d %B %Y")
+_SLASH_DATE_FORMATS = ("%m/%d/%Y", "%m/%d/%y")
+
+_RE_POSTS_URL = re.compile(r"/posts/(\d+)")
+_RE_PFBID = re.compile(r"pfbid[a-zA-Z0-9]+")
+_RE_TOP_LEVEL_POST_ID = re.compile(r'"top_level_post_id":"(\d+)"')
+
+_RE_REACTIONS_BREAKDOWN = re.compile(
+    r"(\d+(?:\.\d+)?(?:,\d{3})*)\s*([kKmM])?\s*(like|love|haha|wow|sad|angry)s?\b",
+    re.IGNORECASE,
+)
+_RE_ALL_REACTIONS = re.compile(r"All reactions:?\s*\n?(\d+)")
+_RE_REACTIONS_OTHERS = re.compile(r"\n(\d+)\n.*(?:and \d+ others|others)")
+_RE_STANDALONE_NUMBER = re.compile(r"\n(\d+)\n")
+_RE_COMMENT_COUNT = re.compile(r"(\d+)\s*comment")
+
+_RE_SEE_MORE_SUFFIX = re.compile(r"\s*…?\s*See more\s*$")
+_RE_SEE_MORE_PREFIX = re.compile(r"^\s*…?\s*See more\s*")
+
+# Feed modules that look like posts but carry no content
+_SKIP_POST_HEADER_PHRASES = (
+    "People you may know",
+    "Suggested for you",
+    "Groups you might like",
+)
+# Exact author-name matches, including the BOM-prefixed variants
+_SKIP_POST_HEADERS = frozenset(
+    _SKIP_POST_HEADER_PHRASES + tuple(f"\ufeff{p}" for p in _SKIP_POST_HEADER_PHRASES)
+)
+_RE_SKIP_POST_HEADER = re.compile("|".join(map(re.escape, _SKIP_POST_HEADER_PHRASES)))
+
+# UI labels that are never post or comment content
+_POST_SKIP_PHRASES = frozenset({"Like", "Comment", "Share", "Reply", "·"})
+_COMMENT_SKIP_WORDS = frozenset(
+    {"Like", "Reply", "Share", "·", "See more", "View replies"}
+)
+
+# Collects every DOM read parse_modern_post needs in a single evaluate() call,
+# instead of one Playwright round trip per selector/attribute/inner_text.
+_MODERN_POST_JS = """
+(el) => {
+    const text = (node) => node.innerText || "";
+    const labels = (selector) => Array.from(
+        el.querySelectorAll(selector), (node) => node.getAttribute("aria-label")
+    );
+    const strong = el.querySelector("strong");
+    const strongLink = strong ? strong.closest("a") : null;
+    return {
+        text: text(el),
+        strongText: strong ? text(strong) : null,
+        strongHref: strongLink ? strongLink.getAttribute("href") || "" : null,
+        // Only candidate author links: /user/ paths or non-group profile URLs
+        links: Array.from(
+            el.querySelectorAll(
+                'a[role="link"][href*="/user/"], '
+                + 'a[role="link"][href*="facebook.com/"]:not([href*="/groups/"])'
+            ),
+            (a) => [a.getAttribute("href") || "", text(a)]
+        ),
+        contentTexts: Array.from(el.querySelectorAll('div[dir="auto"]'), text),
+        timeLinks: Array.from(
+            el.querySelectorAll('a[href*="/posts/"], a[href*="?story_fbid"]'),
+            (a) => [a.getAttribute("aria-label"), text(a)]
+        ),
+        hrefs: Array.from(
+            el.querySelectorAll("a[href]"), (a) => a.getAttribute("href")
+        ),
+        reactionLabels: labels('[aria-label*="reaction"], [aria-label*="like"]'),
+        commentLabels: labels('[aria-label*="comment"], [aria-label*="Comment"]'),
+    };
+}
+"""
+
+
+# Same idea for parse_modern_comment: one evaluate() per comment element.
+_MODERN_COMMENT_JS = """
+(el) => {
+    const text = (node) => node.innerText || "";
+    const strong = el.querySelector("strong");
+    return {
+        text: text(el),
+        strongText: strong ? text(strong) : null,
+        // Only candidate profile links: non-group facebook.com URLs
+        links: Array.from(
+            el.querySelectorAll(
+                'a[role="link"][href*="facebook.com/"]:not([href*="/groups/"])'
+            ),
+            (a) => [a.getAttribute("href") || "", text(a)]
+        ),
+        contentTexts: Array.from(el.querySelectorAll('div[dir="auto"]'), text),
+        reactionLabels: Array.from(
+            el.querySelectorAll('[aria-label*="reaction"], [aria-label*="like"]'),
+            (node) => node.getAttribute("aria-label")
+        ),
+    };
+}
+"""
+
 
 def _stable_id(prefix: str, *parts: str) -> str:
     hasher = hashlib.sha256()
@@ -21,24 +156,29 @@ def _stable_id(prefix: str, *parts: str) -> str:
     return f"{prefix}_{hasher.hexdigest()[:16]}"
 
 
+def _is_short_timestamp(text: str) -> bool:
+    """Return True for relative time tokens like "6d" or "12h"."""
+    return len(text) > 1 and text[-1] in "hdwm" and text[:-1].isdecimal()
+
+
 def _parse_compact_int(text: str) -> int:
     if not text:
         return 0
 
     cleaned = text.replace(",", "").strip()
 
-    compact_match = re.search(r"(\d+(?:\.\d+)?)\s*([kKmM])\b", cleaned)
+    compact_match = _RE_COMPACT_NUMBER.search(cleaned)
     if compact_match:
         number = float(compact_match.group(1))
         suffix = compact_match.group(2).lower()
         multiplier = 1_000 if suffix == "k" else 1_000_000
         return int(number * multiplier)
 
-    match = re.search(r"(\d+)", cleaned)
+    match = _RE_NUMBER.search(cleaned)
     return int(match.group(1)) if match else 0
 
 
-def parse_timestamp(text: str) -> Optional[datetime]:
+def parse_timestamp(text: str, now: Optional[datetime] = None) -> Optional[datetime]:
     """
     Parse Facebook's relative/absolute timestamps to datetime.
 
@@ -49,6 +189,10 @@ def parse_timestamp(text: str) -> Optional[datetime]:
     - "Yesterday at 3:45 PM"
     - "January 15 at 2:30 PM"
     - "January 15, 2024 at 2:30 PM"
+    - "2024-01-15T14:30:00" (ISO 8601)
+
+    Relative times are resolved against ``now`` (default: the current time),
+    so callers parsing several timestamps can share one reference point.
     """
     if not text:
         return None
@@ -57,41 +201,35 @@ def parse_timestamp(text: str) -> Optional[datetime]:
     if not text:
         return None
 
-    now = datetime.now()
+    # ISO-8601 (e.g. from datetime attributes) is far cheaper than strptime
+    if text[:4].isdigit() and "-" in text[:10]:
+        try:
+            parsed = datetime.fromisoformat(text)
+        except ValueError:
+            pass
+        else:
+            if parsed.tzinfo is not None:
+                # Keep results naive local time, like every other branch
+                parsed = parsed.astimezone().replace(tzinfo=None)
+            return parsed
+
+    if now is None:
+        now = datetime.now()
     lower_text = text.lower()
 
     if "just now" in lower_text:
         return now
 
-    relative_patterns = [
-        (
-            r"(\d+)\s*(?:m|min|mins|minute|minutes)\b",
-            lambda n: now - timedelta(minutes=n),
-        ),
-        (
-            r"(\d+)\s*(?:h|hr|hrs|hour|hours)\b",
-            lambda n: now - timedelta(hours=n),
-        ),
-        (r"(\d+)\s*(?:d|day|days)\b", lambda n: now - timedelta(days=n)),
-        (r"(\d+)\s*(?:w|wk|wks|week|weeks)\b", lambda n: now - timedelta(weeks=n)),
-        # Approximate long ranges; most scrapes target recent posts.
-        (r"(\d+)\s*(?:mo|mos|month|months)\b", lambda n: now - timedelta(days=30 * n)),
-        (r"(\d+)\s*(?:y|yr|yrs|year|years)\b", lambda n: now - timedelta(days=365 * n)),
-    ]
-
-    for pattern, handler in relative_patterns:
-        match = re.search(pattern, lower_text)
+    for pattern, delta in _RELATIVE_PATTERNS:
+        match = pattern.search(lower_text)
         if match:
-            return handler(int(match.group(1)))
+            return now - delta(int(match.group(1)))
 
     if "yesterday" in lower_text:
-        time_match = re.search(
-            r"yesterday\s*(?:at\s*)?(\d{1,2}(?::\d{2})?\s*[APap][Mm])",
-            text,
-        )
+        time_match = _RE_YESTERDAY_TIME.search(text)
         if time_match:
             time_str = time_match.group(1).strip().upper()
-            time_str = re.sub(r"\s*(AM|PM)$", r" \1", time_str)
+            time_str = _RE_AM_PM_SUFFIX.sub(r" \1", time_str)
 
             for time_fmt in ("%I:%M %p", "%I %p"):
                 try:
@@ -104,16 +242,13 @@ def parse_timestamp(text: str) -> Optional[datetime]:
 
         return now - timedelta(days=1)
 
-    date_formats = [
-        "%B %d, %Y at %I:%M %p",
-        "%b %d, %Y at %I:%M %p",
-        "%B %d, %Y",
-        "%b %d, %Y",
-        "%d %b %Y",
-        "%d %B %Y",
-        "%m/%d/%Y",
-        "%m/%d/%y",
-    ]
+    # Only try the absolute formats that can match the text's shape
+    if "/" in text:
+        date_formats = _SLASH_DATE_FORMATS
+    elif text[0].isalpha():
+        date_formats = _MONTH_FIRST_DATE_FORMATS
+    else:
+        date_formats = _DAY_FIRST_DATE_FORMATS
 
     for fmt in date_formats:
         try:
@@ -122,16 +257,12 @@ def parse_timestamp(text: str) -> Optional[datetime]:
             continue
 
     # Yearless month/day formats (avoid strptime default-year deprecation).
-    month_day_at_match = re.match(
-        r"^([A-Za-z]+\.?)\s+(\d{1,2})\s+at\s+(.+)$",
-        text,
-        re.IGNORECASE,
-    )
+    month_day_at_match = _RE_MONTH_DAY_AT.match(text)
     if month_day_at_match:
         month, day, time_part = month_day_at_match.groups()
         month = month.rstrip(".")
         time_str = time_part.strip().upper()
-        time_str = re.sub(r"\s*(AM|PM)$", r" \1", time_str)
+        time_str = _RE_AM_PM_SUFFIX.sub(r" \1", time_str)
 
         candidate = f"{month} {int(day)} {now.year} at {time_str}"
         for fmt in (
@@ -145,7 +276,7 @@ def parse_timestamp(text: str) -> Optional[datetime]:
             except ValueError:
                 continue
 
-    month_day_match = re.match(r"^([A-Za-z]+\.?)\s+(\d{1,2})$", text, re.IGNORECASE)
+    month_day_match = _RE_MONTH_DAY.match(text)
     if month_day_match:
         month, day = month_day_match.groups()
         month = month.rstrip(".")
@@ -172,11 +303,11 @@ def extract_post_id(url: str) -> Optional[str]:
         if story_fbid:
             return story_fbid
 
-    match = re.search(r"/posts/(\d+)", url)
+    match = _RE_POSTS_URL.search(url)
     if match:
         return match.group(1)
 
-    match = re.search(r"pfbid[a-zA-Z0-9]+", url)
+    match = _RE_PFBID.search(url)
     if match:
         return match.group(0)
 
@@ -205,12 +336,7 @@ def parse_reactions_text(text: str) -> Reactions:
         "angry": 0,
     }
 
-    breakdown_pattern = re.compile(
-        r"(\d+(?:\.\d+)?(?:,\d{3})*)\s*([kKmM])?\s*(like|love|haha|wow|sad|angry)s?\b",
-        re.IGNORECASE,
-    )
-
-    for number, suffix, reaction in breakdown_pattern.findall(text):
+    for number, suffix, reaction in _RE_REACTIONS_BREAKDOWN.findall(text):
         key = reaction.lower().rstrip("s")
         count = _parse_compact_int(f"{number}{suffix or ''}")
         if key in breakdown:
@@ -232,245 +358,220 @@ def parse_modern_post(
 ) -> Optional[Post]:
     """Parse a post from www.facebook.com (modern React UI)."""
     try:
-        # Get all text content from the article
-        all_text = article.inner_text()
-        lines = [line.strip() for line in all_text.split("\n") if line.strip()]
+        # One browser round trip; the heuristics run on the returned snapshot
+        data = article.evaluate(_MODERN_POST_JS)
+        return _parse_modern_post_data(data, skip_reactions=skip_reactions)
+    except Exception:
+        return None
 
-        # Author is typically in a link with user profile - look for the first prominent link
-        author_name = "Unknown"
-        profile_url = None
 
-        # Try to find author from strong tag ONLY if it's inside a profile link
-        # (strong tags can also be post titles/bold content, not just author names)
-        strong_elem = article.query_selector("strong")
-        if strong_elem:
-            parent_link = strong_elem.query_selector("xpath=ancestor::a")
-            if parent_link:
-                href = parent_link.get_attribute("href") or ""
-                # Only use strong if parent link is a user profile (not a group link)
-                if "/user/" in href or (
-                    "facebook.com/" in href
-                    and "/groups/" not in href
-                    and "/posts/" not in href
-                ):
-                    strong_text = strong_elem.inner_text().strip()
-                    # Validate: author names are typically short (< 50 chars)
-                    # and don't contain newlines
-                    if len(strong_text) < 50 and "\n" not in strong_text:
-                        author_name = strong_text
-                        profile_url = href
-
-        # Primary method: look for profile links with user names
-        if author_name == "Unknown":
-            author_links = article.query_selector_all('a[role="link"]')
-            for link in author_links:
-                href = link.get_attribute("href") or ""
-                link_text = link.inner_text().strip()
-                # Author links typically have short text (names) and point to profiles
-                # Must contain /user/ or be a direct facebook.com profile link
-                if (
-                    len(link_text) > 2
-                    and len(link_text) < 50
-                    and "\n" not in link_text
-                    and (
-                        "/user/" in href
-                        or (
-                            "facebook.com/" in href
-                            and "/groups/" not in href
-                            and "/posts/" not in href
-                            and "?" not in href.split("/")[-1]
-                        )
-                    )
-                ):
-                    author_name = link_text
-                    profile_url = href
-                    break
+def _parse_modern_post_data(
+    data: dict[str, Any],
+    *,
+    skip_reactions: bool = False,
+) -> Optional[Post]:
+    """Build a Post from the DOM snapshot returned by _MODERN_POST_JS."""
+    all_text: str = data["text"]
+    lines = list(filter(None, map(str.strip, all_text.split("\n"))))
+
+    # Author is typically in a link with user profile - look for the first prominent link
+    author_name = "Unknown"
+    profile_url = None
+
+    # Try to find author from strong tag ONLY if it's inside a profile link
+    # (strong tags can also be post titles/bold content, not just author names)
+    href = data["strongHref"]
+    if href is not None:
+        # Only use strong if parent link is a user profile (not a group link)
+        if "/user/" in href or (
+            "facebook.com/" in href and "/groups/" not in href and "/posts/" not in href
+        ):
+            strong_text = data["strongText"].strip()
+            # Validate: author names are typically short (< 50 chars)
+            # and don't contain newlines
+            if len(strong_text) < 50 and "\n" not in strong_text:
+                author_name = strong_text
+                profile_url = href
 
-        # Fallback: use first line if it looks like a name
-        if author_name == "Unknown" and lines:
-            first_line = lines[0]
-            # Names are short, don't start with digits, and don't contain certain keywords
+    # Primary method: look for profile links with user names
+    if author_name == "Unknown":
+        for href, link_text in data["links"]:
+            link_text = link_text.strip()
+            # Author links typically have short text (names) and point to profiles
+            # Must contain /user/ or be a direct facebook.com profile link
             if (
-                len(first_line) < 50
-                and not any(c.isdigit() for c in first_line[:5])
-                and "\n" not in first_line
+                len(link_text) > 2
+                and len(link_text) < 50
+                and "\n" not in link_text
+                and (
+                    "/user/" in href
+                    or (
+                        "facebook.com/" in href
+                        and "/groups/" not in href
+                        and "/posts/" not in href
+                        and "?" not in href.split("/")[-1]
+                    )
+                )
             ):
-                author_name = first_line
-
-        # Clean up author name - remove "is with X", "shared a post", etc.
-        if " is with " in author_name:
-            author_name = author_name.split(" is with ")[0]
-        if " shared " in author_name:
-            author_name = author_name.split(" shared ")[0]
-        if " updated " in author_name:
-            author_name = author_name.split(" updated ")[0]
-
-        # Skip posts that are clearly non-content (suggestions, sponsored, etc.)
-        skip_posts = [
-            "People you may know",
-            "\ufeffPeople you may know",
-            "Suggested for you",
-            "Groups you might like",
-        ]
-        if author_name in skip_posts or any(s in all_text[:100] for s in skip_posts):
-            return None
-
-        # Filter out known non-author text
-        invalid_authors = ["Online status indicator", "Active", "Sponsored"]
-        if author_name in invalid_authors:
-            author_name = "Unknown"
-
-        # Content: find the main post text
-        # The post content is usually in a div[dir="auto"] that's NOT inside buttons/links
-        # and has substantial text
-        content_divs = article.query_selector_all('div[dir="auto"]')
-        content_parts = []
-
-        skip_phrases = ["Like", "Comment", "Share", "Reply", author_name, "·"]
-
-        for div in content_divs:
-            text = div.inner_text().strip()
-            # Skip if too short, is the author name, or is a UI element
-            if len(text) < 10:
-                continue
-            if text == author_name:
+                author_name = link_text
+                profile_url = href
+                break
+
+    # Fallback: use first line if it looks like a name
+    if author_name == "Unknown" and lines:
+        first_line = lines[0]
+        # Names are short, don't start with digits, and don't contain certain keywords
+        if (
+            len(first_line) < 50
+            and not any(c.isdigit() for c in first_line[:5])
+            and "\n" not in first_line
+        ):
+            author_name = first_line
+
+    # Clean up author name - remove "is with X", "shared a post", etc.
+    if " is with " in author_name:
+        author_name = author_name.split(" is with ")[0]
+    if " shared " in author_name:
+        author_name = author_name.split(" shared ")[0]
+    if " updated " in author_name:
+        author_name = author_name.split(" updated ")[0]
+
+    # Skip posts that are clearly non-content (suggestions, sponsored, etc.)
+    if author_name in _SKIP_POST_HEADERS or _RE_SKIP_POST_HEADER.search(
+        all_text, 0, 100
+    ):
+        return None
+
+    # Filter out known non-author text
+    invalid_authors = ["Online status indicator", "Active", "Sponsored"]
+    if author_name in invalid_authors:
+        author_name = "Unknown"
+
+    # Content: find the main post text
+    # The post content is usually in a div[dir="auto"] that's NOT inside buttons/links
+    # and has substantial text
+    content_parts = []
+
+    for text in data["contentTexts"]:
+        text = text.strip()
+        # Skip if too short, is the author name, or is a UI element
+        if len(text) < 10:
+            continue
+        if text == author_name or text in _POST_SKIP_PHRASES:
+            continue
+        # Skip single-word timestamps
+        if _is_short_timestamp(text):
+            continue
+        # This looks like real content
+        content_parts.append(text)
+
+    # Strip "See more" markers, then dedupe while preserving order
+    cleaned_parts = (
+        _RE_SEE_MORE_PREFIX.sub("", _RE_SEE_MORE_SUFFIX.sub("", part.strip()))
+        for part in content_parts
+    )
+    unique_parts = list(dict.fromkeys(part for part in cleaned_parts if part))
+
+    content = "\n".join(unique_parts[:2]) if unique_parts else ""
+
+    # If still no content, try to extract from the full text
+    if not content and len(lines) > 2:
+        # Filter out likely non-content lines
+        filtered_lines = []
+        for line in lines:
+            if line == author_name:
                 continue
-            if any(text == phrase for phrase in skip_phrases):
+            if _is_short_timestamp(line):  # timestamps like "6d"
                 continue
-            # Skip single-word timestamps
-            if re.match(r"^\d+[hdwm]$", text):
+            if line in ["Like", "Comment", "Share", "·", "+3", "+1", "+2"]:
                 continue
-            # This looks like real content
-            content_parts.append(text)
+            if len(line) > 10:
+                filtered_lines.append(line)
+        content = "\n".join(filtered_lines[:3])
 
-        # Dedupe while preserving order
-        seen = set()
-        unique_parts = []
-        for part in content_parts:
-            # Clean up the text
-            cleaned = part.strip()
-            # Remove "See more" suffix
-            cleaned = re.sub(r"\s*…?\s*See more\s*$", "", cleaned)
-            cleaned = re.sub(r"^\s*…?\s*See more\s*", "", cleaned)
-            if cleaned and cleaned not in seen:
-                seen.add(cleaned)
-                unique_parts.append(cleaned)
-
-        content = "\n".join(unique_parts[:2]) if unique_parts else ""
-
-        # If still no content, try to extract from the full text
-        if not content and len(lines) > 2:
-            # Filter out likely non-content lines
-            filtered_lines = []
-            for line in lines:
-                if line == author_name:
-                    continue
-                if re.match(r"^\d+[hdwm]$", line):  # timestamps like "6d"
-                    continue
-                if line in ["Like", "Comment", "Share", "·", "+3", "+1", "+2"]:
-                    continue
-                if len(line) > 10:
-                    filtered_lines.append(line)
-            content = "\n".join(filtered_lines[:3])
+    # Find timestamp - look for aria-label with time info or links with timestamps
+    timestamp = None
+    now = datetime.now()
+    for aria, link_text in data["timeLinks"]:
+        if aria:
+            timestamp = parse_timestamp(aria, now)
+            if timestamp:
+                break
+        link_text = link_text.strip()
+        if link_text and any(
+            t in link_text.lower()
+            for t in ["h", "d", "w", "min", "yesterday", "just now"]
+        ):
+            timestamp = parse_timestamp(link_text, now)
+            if timestamp:
+                break
 
-        # Find timestamp - look for aria-label with time info or links with timestamps
-        timestamp = None
-        time_links = article.query_selector_all(
-            'a[href*="/posts/"], a[href*="?story_fbid"]'
-        )
-        for link in time_links:
-            aria = link.get_attribute("aria-label")
-            if aria:
-                timestamp = parse_timestamp(aria)
-                if timestamp:
-                    break
-            link_text = link.inner_text().strip()
-            if link_text and any(
-                t in link_text.lower()
-                for t in ["h", "d", "w", "min", "yesterday", "just now"]
-            ):
-                timestamp = parse_timestamp(link_text)
-                if timestamp:
-                    break
+    # Extract post ID from any permalink
+    post_id = None
+    for href in data["hrefs"]:
+        if href:
+            post_id = extract_post_id(href)
+            if post_id:
+                break
 
-        # Extract post ID from any permalink
-        post_id = None
-        all_links = article.query_selector_all("a[href]")
-        for link in all_links:
-            href = link.get_attribute("href")
-            if href:
-                post_id = extract_post_id(href)
-                if post_id:
-                    break
+    if not post_id:
+        post_id = _stable_id(
+            "post",
+            author_name,
+            profile_url or "",
+            content,
+        )
 
-        if not post_id:
-            post_id = _stable_id(
-                "post",
-                author_name,
-                profile_url or "",
-                content,
-            )
+    # Reactions: look for reaction counts in various places
+    reactions = Reactions()
 
-        # Reactions: look for reaction counts in various places
-        reactions = Reactions()
+    if not skip_reactions:
+        # Try aria-labels first
+        for aria in data["reactionLabels"]:
+            aria = aria or ""
+            if "reaction" in aria.lower() or "like" in aria.lower():
+                reactions = parse_reactions_text(aria)
+                if reactions.total > 0:
+                    break
 
-        if not skip_reactions:
-            # Try aria-labels first
-            reaction_elements = article.query_selector_all(
-                '[aria-label*="reaction"], [aria-label*="like"]'
-            )
-            for elem in reaction_elements:
-                aria = elem.get_attribute("aria-label") or ""
-                if "reaction" in aria.lower() or "like" in aria.lower():
-                    reactions = parse_reactions_text(aria)
-                    if reactions.total > 0:
-                        break
-
-            # Try finding reaction count in text like "All reactions:\n44"
-            if reactions.total == 0:
-                # Look for "All reactions:" followed by a number
-                match = re.search(r"All reactions:?\s*\n?(\d+)", all_text)
+        # Try finding reaction count in text like "All reactions:\n44"
+        if reactions.total == 0:
+            # Look for "All reactions:" followed by a number. The substring
+            # checks skip regex scans of posts that can't match.
+            if "All reactions" in all_text:
+                match = _RE_ALL_REACTIONS.search(all_text)
                 if match:
                     reactions = Reactions(total=int(match.group(1)))
 
-                # Also try just standalone numbers near "reactions" or after names
-                if reactions.total == 0:
-                    match = re.search(
-                        r"\n(\d+)\n.*(?:and \d+ others|others)",
-                        all_text,
-                    )
-                    if match:
-                        reactions = Reactions(total=int(match.group(1)))
-
-        # Comments count
-        comments_count = 0
-        comment_buttons = article.query_selector_all(
-            '[aria-label*="comment"], [aria-label*="Comment"]'
-        )
-        for btn in comment_buttons:
-            aria = btn.get_attribute("aria-label") or ""
-            match = re.search(r"(\d+)\s*comment", aria.lower())
-            if match:
-                comments_count = int(match.group(1))
-                break
-
-        # Only return if we have some content
-        if not content or len(content) < 5:
-            return None
+            # Also try just standalone numbers near "reactions" or after names
+            if reactions.total == 0 and "others" in all_text:
+                match = _RE_REACTIONS_OTHERS.search(all_text)
+                if match:
+                    reactions = Reactions(total=int(match.group(1)))
 
-        return Post(
-            id=post_id,
-            author=Author(name=author_name, profile_url=profile_url),
-            content=content,
-            timestamp=timestamp,
-            reactions=reactions,
-            comments_count=comments_count,
-            comments=[],
-        )
+    # Comments count
+    comments_count = 0
+    for aria in data["commentLabels"]:
+        aria = aria or ""
+        match = _RE_COMMENT_COUNT.search(aria.lower())
+        if match:
+            comments_count = int(match.group(1))
+            break
 
-    except Exception:
+    # Only return if we have some content
+    if not content or len(content) < 5:
         return None
 
+    return Post(
+        id=post_id,
+        author=Author(name=author_name, profile_url=profile_url),
+        content=content,
+        timestamp=timestamp,
+        reactions=reactions,
+        comments_count=comments_count,
+        comments=[],
+    )
+
 
 def parse_mbasic_post(article: ElementHandle, page: Page) -> Optional[Post]:
     """Parse a post from mbasic.facebook.com HTML."""
@@ -517,7 +618,7 @@ def parse_mbasic_post(article: ElementHandle, page: Page) -> Optional[Post]:
         if not post_id:
             data_ft = article.get_attribute("data-ft")
             if data_ft:
-                match = re.search(r'"top_level_post_id":"(\d+)"', data_ft)
+                match = _RE_TOP_LEVEL_POST_ID.search(data_ft)
                 if match:
                     post_id = match.group(1)
 
@@ -539,7 +640,7 @@ def parse_mbasic_post(article: ElementHandle, page: Page) -> Optional[Post]:
         comment_link = article.query_selector('a[href*="comment"]')
         if comment_link:
             comment_text = comment_link.inner_text()
-            count_match = re.search(r"(\d+)", comment_text)
+            count_match = _RE_NUMBER.search(comment_text)
             if count_match:
                 comments_count = int(count_match.group(1))
 
@@ -616,122 +717,136 @@ def parse_modern_comment(
 ) -> Optional[Comment]:
     """Parse a comment from www.facebook.com (modern React UI)."""
     try:
-        all_text = element.inner_text()
-        lines = [line.strip() for line in all_text.split("\n") if line.strip()]
+        # One browser round trip; the heuristics run on the returned snapshot
+        data = element.evaluate(_MODERN_COMMENT_JS)
+        return _parse_modern_comment_data(data, skip_reactions=skip_reactions)
+    except Exception:
+        return None
 
-        if not lines:
-            return None
 
-        # Author is usually in a strong tag or first link
-        author_name = "Unknown"
-        profile_url = None
+def _parse_modern_comment_data(
+    data: dict[str, Any],
+    *,
+    skip_reactions: bool = False,
+) -> Optional[Comment]:
+    """Build a Comment from the DOM snapshot returned by _MODERN_COMMENT_JS."""
+    all_text: str = data["text"]
+    lines = list(filter(None, map(str.strip, all_text.split("\n"))))
 
-        strong = element.query_selector("strong")
-        if strong:
-            author_name = strong.inner_text().strip()
+    if not lines:
+        return None
 
-        # Try to find profile link
-        links = element.query_selector_all('a[role="link"]')
-        for link in links:
-            href = link.get_attribute("href") or ""
-            text = link.inner_text().strip()
-            if (
-                text
-                and len(text) < 50
-                and "facebook.com/" in href
-                and "/groups/" not in href
-            ):
-                if author_name == "Unknown":
-                    author_name = text
-                profile_url = href
-                break
+    # Author is usually in a strong tag or first link
+    author_name = "Unknown"
+    profile_url = None
+
+    strong_text = data["strongText"]
+    if strong_text is not None:
+        author_name = strong_text.strip()
+
+    # Try to find profile link
+    for href, text in data["links"]:
+        text = text.strip()
+        if (
+            text
+            and len(text) < 50
+            and "facebook.com/" in href
+            and "/groups/" not in href
+        ):
+            if author_name == "Unknown":
+                author_name = text
+            profile_url = href
+            break
+
+    # Content: look for text that's not the author name or UI elements
+    content_parts = []
+    for text in data["contentTexts"]:
+        text = text.strip()
+        if (
+            text
+            and len(text) > 5
+            and text not in _COMMENT_SKIP_WORDS
+            and text != author_name
+        ):
+            # Skip timestamps
+            if _is_short_timestamp(text):
+                continue
+            content_parts.append(text)
 
-        # Content: look for text that's not the author name or UI elements
-        content_parts = []
-        skip_words = [
-            "Like",
-            "Reply",
-            "Share",
-            "·",
-            author_name,
-            "See more",
-            "View replies",
-        ]
-
-        content_divs = element.query_selector_all('div[dir="auto"]')
-        for div in content_divs:
-            text = div.inner_text().strip()
-            if text and len(text) > 5 and text not in skip_words:
-                # Skip timestamps
-                if re.match(r"^\d+[hdwm]$", text):
-                    continue
-                content_parts.append(text)
+    # Dedupe while preserving order
+    cleaned_parts = (
+        _RE_SEE_MORE_SUFFIX.sub("", part).strip() for part in content_parts
+    )
+    unique_parts = list(
+        dict.fromkeys(part for part in cleaned_parts if part and part != author_name)
+    )
 
-        # Dedupe
-        seen = set()
-        unique_parts = []
-        for part in content_parts:
-            cleaned = re.sub(r"\s*…?\s*See more\s*$", "", part).strip()
-            if cleaned and cleaned not in seen and cleaned != author_name:
-                seen.add(cleaned)
-                unique_parts.append(cleaned)
+    content = unique_parts[0] if unique_parts else ""
 
-        content = unique_parts[0] if unique_parts else ""
+    if not content:
+        # Fallback: try to extract from lines
+        for line in lines:
+            if line == author_name:
+                continue
+            if line in _COMMENT_SKIP_WORDS:
+                continue
+            if _is_short_timestamp(line):
+                continue
+            if len(line) > 5:
+                content = line
+                break
 
-        if not content:
-            # Fallback: try to extract from lines
-            for line in lines:
-                if line == author_name:
-                    continue
-                if line in skip_words:
-                    continue
-                if re.match(r"^\d+[hdwm]$", line):
-                    continue
-                if len(line) > 5:
-                    content = line
-                    break
+    if not content:
+        return None
 
-        if not content:
-            return None
+    # Generate comment ID
+    comment_id = _stable_id(
+        "comment",
+        author_name,
+        profile_url or "",
+        content,
+    )
 
-        # Generate comment ID
-        comment_id = _stable_id(
-            "comment",
-            author_name,
-            profile_url or "",
-            content,
-        )
+    # Try to get reaction count
+    reactions = Reactions()
 
-        # Try to get reaction count
-        reactions = Reactions()
+    if not skip_reactions:
+        for aria in data["reactionLabels"]:
+            aria = aria or ""
+            if "reaction" in aria.lower():
+                reactions = parse_reactions_text(aria)
+                break
 
-        if not skip_reactions:
-            reaction_elems = element.query_selector_all(
-                '[aria-label*="reaction"], [aria-label*="like"]'
-            )
-            for elem in reaction_elems:
-                aria = elem.get_attribute("aria-label") or ""
-                if "reaction" in aria.lower():
-                    reactions = parse_reactions_text(aria)
-                    break
+        # Also try text-based reaction count
+        if reactions.total == 0:
+            match = _RE_STANDALONE_NUMBER.search(all_text)
+            if match:
+                reactions = Reactions(total=int(match.group(1)))
+
+    return Comment(
+        id=comment_id,
+        author=Author(name=author_name, profile_url=profile_url),
+        content=content,
+        timestamp=None,
+        reactions=reactions,
+        replies=[],
+    )
 
-            # Also try text-based reaction count
-            if reactions.total == 0:
-                match = re.search(r"\n(\d+)\n", all_text)
-                if match:
-                    reactions = Reactions(total=int(match.group(1)))
 
-        return Comment(
-            id=comment_id,
-            author=Author(name=author_name, profile_url=profile_url),
-            content=content,
-            timestamp=None,
-            reactions=reactions,
-            replies=[],
-        )
+def _filter_level(
+    comments: list[Comment], min_reactions: int, top_n: int
+) -> list[Comment]:
+    """Apply the popularity filter to one level of a comment thread."""
+    filtered = comments
 
-    except Exception:
-        return None
+    if min_reactions > 0:
+        filtered = [c for c in filtered if c.reactions.total >= min_reactions]
+
+    if top_n > 0:
+        # Same result as sorted(..., reverse=True)[:top_n], without a full sort
+        filtered = heapq.nlargest(top_n, filtered, key=lambda c: c.reactions.total)
+
+    return filtered
 
 
 def filter_comments(
@@ -750,22 +865,14 @@ def filter_comments(
     Returns:
         Filtered list of comments
     """
-    filtered = comments
-
-    if min_reactions > 0:
-        filtered = [c for c in filtered if c.reactions.total >= min_reactions]
+    filtered = _filter_level(comments, min_reactions, top_n)
 
-    if top_n > 0:
-        filtered = sorted(filtered, key=lambda c: c.reactions.total, reverse=True)[
-            :top_n
-        ]
-
-    for comment in filtered:
+    # Walk reply threads with a worklist so deep threads don't recurse
+    stack = list(filtered)
+    while stack:
+        comment = stack.pop()
         if comment.replies:
-            comment.replies = filter_comments(
-                comment.replies,
-                min_reactions=min_reactions,
-                top_n=top_n,
-            )
+            comment.replies = _filter_level(comment.replies, min_reactions, top_n)
+            stack.extend(comment.replies)
 
     return filtered
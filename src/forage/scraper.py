@@ -38,6 +38,8 @@ from forage.parser import (
 
 T = TypeVar("T")
 
+_RE_GROUP_URL = re.compile(r"facebook\.com/groups/([^/?#]+)", re.IGNORECASE)
+
 console = Console(stderr=True)
 
 
@@ -180,18 +182,9 @@ def normalize_group_identifier(group: str) -> str:
     """
     group = group.strip()
 
-    patterns = [
-        r"facebook\.com/groups/([^/?]+)",
-        r"^(\d+)$",
-        r"^([a-zA-Z][\w.-]+)$",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, group)
-        if match:
-            return match.group(1)
-
-    return group
+    # Bare IDs and slugs are already in the right form
+    match = _RE_GROUP_URL.search(group)
+    return match.group(1) if match else group
 
 
 def get_group_url(group_id: str) -> str:
@@ -512,7 +505,7 @@ def scrape_group(group: str, options: ScrapeOptions) -> ScrapeResult:
                     break
 
                 all_articles = feed.query_selector_all('[role="article"]')
-                articles = []
+                articles: list[tuple[ElementHandle, str]] = []
                 for article in all_articles:
                     aria_label = article.get_attribute("aria-label") or ""
                     # Skip elements that are explicitly comments
@@ -522,7 +515,7 @@ def scrape_group(group: str, options: ScrapeOptions) -> ScrapeResult:
                     text = article.inner_text().strip()
                     if not text or len(text) < 20:
                         continue
-                    articles.append(article)
+                    articles.append((article, text))
 
                 if options.verbose and len(posts) == 0:
                     console.print(
@@ -532,10 +525,10 @@ def scrape_group(group: str, options: ScrapeOptions) -> ScrapeResult:
 
                 new_posts_this_page = 0
 
-                for i, article in enumerate(articles):
+                for i, (article, article_text) in enumerate(articles):
                     if options.verbose and len(posts) == 0 and i < 2:
-                        article_text = article.inner_text()
-                        inner = article_text[:200] if article_text else "(empty)"
+                        # Reuse the text read while filtering (no extra IPC)
+                        inner = article_text[:200]
                         console.print(f"Article {i} preview: {repr(inner)}")
 
                     post = parse_modern_post(
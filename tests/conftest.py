@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
 import pytest
+from playwright.sync_api import (
+    ElementHandle,
+    Page,
+    sync_playwright,
+    Error as PlaywrightError,
+)
+
+from forage.parser import _MODERN_COMMENT_JS, _MODERN_POST_JS
 
 if TYPE_CHECKING:
     pass
@@ -21,15 +31,94 @@ def fixtures_dir() -> Path:
     return FIXTURES_DIR
 
 
+def _anchors(html_content: str) -> list[tuple[dict[str, str], str]]:
+    """Return (attributes, text) for each <a> element in the HTML."""
+    anchors = []
+    for attrs, inner in re.findall(r"<a\b([^>]*)>(.*?)</a>", html_content, re.DOTALL):
+        attributes = dict(re.findall(r'([\w-]+)="([^"]*)"', attrs))
+        anchors.append((attributes, re.sub(r"<[^>]+>", "", inner).strip()))
+    return anchors
+
+
+def _modern_post_snapshot(html_content: str, text_content: str) -> dict[str, object]:
+    """Mimic what _MODERN_POST_JS returns for the given HTML."""
+    anchors = _anchors(html_content)
+    aria_labels = re.findall(r'aria-label="([^"]*)"', html_content)
+
+    strong = re.search(r"<strong>([^<]+)</strong>", html_content)
+    strong_link = re.search(
+        r"<a\b([^>]*)>(?:(?!</a>).)*?<strong>", html_content, re.DOTALL
+    )
+    strong_href = None
+    if strong_link:
+        strong_href = dict(re.findall(r'([\w-]+)="([^"]*)"', strong_link.group(1))).get(
+            "href", ""
+        )
+
+    return {
+        "text": text_content,
+        "strongText": strong.group(1) if strong else None,
+        "strongHref": strong_href,
+        "links": [
+            [attrs.get("href", ""), text]
+            for attrs, text in anchors
+            if attrs.get("role") == "link"
+            and (
+                "/user/" in attrs.get("href", "")
+                or (
+                    "facebook.com/" in attrs.get("href", "")
+                    and "/groups/" not in attrs.get("href", "")
+                )
+            )
+        ],
+        "contentTexts": re.findall(r'<div dir="auto">([^<]+)</div>', html_content),
+        "timeLinks": [
+            [attrs.get("aria-label"), text]
+            for attrs, text in anchors
+            if "/posts/" in attrs.get("href", "")
+            or "?story_fbid" in attrs.get("href", "")
+        ],
+        "hrefs": [attrs["href"] for attrs, _ in anchors if "href" in attrs],
+        "reactionLabels": [
+            label for label in aria_labels if "reaction" in label or "like" in label
+        ],
+        "commentLabels": [
+            label for label in aria_labels if "comment" in label or "Comment" in label
+        ],
+    }
+
+
+def _modern_comment_snapshot(html_content: str, text_content: str) -> dict[str, object]:
+    """Mimic what _MODERN_COMMENT_JS returns for the given HTML."""
+    post = _modern_post_snapshot(html_content, text_content)
+    return {
+        "text": text_content,
+        "strongText": post["strongText"],
+        "links": [
+            [attrs.get("href", ""), text]
+            for attrs, text in _anchors(html_content)
+            if attrs.get("role") == "link"
+            and "facebook.com/" in attrs.get("href", "")
+            and "/groups/" not in attrs.get("href", "")
+        ],
+        "contentTexts": post["contentTexts"],
+        "reactionLabels": post["reactionLabels"],
+    }
+
+
 def create_mock_element(html_content: str) -> MagicMock:
     """Create a mock ElementHandle from HTML content."""
     mock = MagicMock(
-        spec=["inner_text", "query_selector", "query_selector_all", "get_attribute"]
+        spec=[
+            "inner_text",
+            "query_selector",
+            "query_selector_all",
+            "get_attribute",
+            "evaluate",
+        ]
     )
 
     # Parse basic text content (simplified)
-    import re
-
     # Extract text between tags
     text_content = re.sub(r"<[^>]+>", "\n", html_content)
     text_content = "\n".join(
@@ -106,13 +195,27 @@ def create_mock_element(html_content: str) -> MagicMock:
 
         return results
 
+    def mock_evaluate(script: str, *args: object) -> dict[str, object]:
+        if script == _MODERN_POST_JS:
+            return _modern_post_snapshot(html_content, text_content)
+        if script == _MODERN_COMMENT_JS:
+            return _modern_comment_snapshot(html_content, text_content)
+        pytest.fail(f"unexpected evaluate() script: {script[:40]!r}")
+
     mock.query_selector.side_effect = mock_query_selector
     mock.query_selector_all.side_effect = mock_query_selector_all
+    mock.evaluate.side_effect = mock_evaluate
     mock.get_attribute.return_value = None
 
     return mock
 
 
+@pytest.fixture
+def make_mock_element() -> Callable[[str], MagicMock]:
+    """Return a factory that builds mock elements from HTML content."""
+    return create_mock_element
+
+
 @pytest.fixture
 def mock_page() -> MagicMock:
     """Create a mock Page object."""
@@ -174,3 +277,28 @@ def sponsored_post_element(sponsored_post_html: str) -> MagicMock:
 def simple_comment_element(simple_comment_html: str) -> MagicMock:
     """Create mock element from simple comment HTML."""
     return create_mock_element(simple_comment_html)
+
+
+@pytest.fixture(scope="session")
+def browser_page() -> Iterator[Page]:
+    """Launch headless Chromium once, for tests that run the parser JS for real."""
+    with sync_playwright() as playwright:
+        try:
+            browser = playwright.chromium.launch(headless=True)
+        except PlaywrightError as e:
+            pytest.skip(f"Chromium is not available: {e.message.splitlines()[0]}")
+        yield browser.new_page()
+        browser.close()
+
+
+@pytest.fixture
+def make_dom_element(browser_page: Page) -> Callable[[str], ElementHandle]:
+    """Return a factory that loads HTML into the browser and returns its root."""
+
+    def make(html_content: str) -> ElementHandle:
+        browser_page.set_content(html_content)
+        element = browser_page.query_selector("body > *")
+        assert element is not None
+        return element
+
+    return make
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -93,6 +94,50 @@ class TestCli:
             assert result.exit_code == 2
             assert "requires --output" in result.output
 
+    def test_scrape_parquet_without_pyarrow(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        """Test Parquet format reports a missing pyarrow."""
+        with (
+            patch("forage.cli.session_exists", return_value=True),
+            patch("forage.cli.scrape_group"),
+            patch("forage.exporter.export_to_parquet", side_effect=ImportError),
+        ):
+            result = runner.invoke(
+                main,
+                ["scrape", "testgroup", "-f", "parquet", "-o", str(tmp_path / "p")],
+            )
+            assert result.exit_code == 2
+            assert "requires pyarrow" in result.output
+
+    def test_scrape_csv_engine_is_passed_through(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        """Test --csv-engine selects the CSV writer."""
+        output = tmp_path / "posts.csv"
+        with (
+            patch("forage.cli.session_exists", return_value=True),
+            patch("forage.cli.scrape_group") as mock_scrape,
+            patch("forage.exporter.export_to_csv") as mock_export,
+        ):
+            result = runner.invoke(
+                main,
+                [
+                    "scrape",
+                    "testgroup",
+                    "-f",
+                    "csv",
+                    "-o",
+                    str(output),
+                    "--csv-engine",
+                    "pyarrow",
+                ],
+            )
+            assert result.exit_code == 0
+            mock_export.assert_called_once_with(
+                mock_scrape.return_value, output, engine="pyarrow"
+            )
+
 
 class TestCliOptions:
     """Tests for CLI option parsing."""
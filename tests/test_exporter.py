@@ -5,16 +5,22 @@ from __future__ import annotations
 import csv
 import json
 import sqlite3
+import sys
 from datetime import datetime
 from pathlib import Path
 
 import pytest
 
 from forage.exporter import (
+    _COMMENT_COLUMNS,
+    _INSERT_COMMENT_SQL,
+    _POST_COLUMNS,
     _detect_pain_signals,
     _post_to_llm_format,
+    _to_columns,
     export_to_csv,
     export_to_llm,
+    export_to_parquet,
     export_to_sqlite,
     get_llm_json,
 )
@@ -29,9 +35,7 @@ from forage.models import (
 )
 
 
-@pytest.fixture
-def sample_result() -> ScrapeResult:
-    """Create a sample scrape result for testing."""
+def _build_sample_result() -> ScrapeResult:
     return ScrapeResult(
         group=GroupInfo(id="123", name="Test Group", url="https://fb.com/groups/123"),
         scraped_at=datetime(2024, 1, 15, 12, 0, 0),
@@ -79,24 +83,60 @@ def sample_result() -> ScrapeResult:
     )
 
 
+@pytest.fixture
+def sample_result() -> ScrapeResult:
+    """Create a sample scrape result for testing."""
+    return _build_sample_result()
+
+
+@pytest.fixture(scope="module")
+def exported_db(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Export the sample result to SQLite once, for read-only tests."""
+    db_path = tmp_path_factory.mktemp("sqlite") / "test.db"
+    export_to_sqlite(_build_sample_result(), db_path)
+    return db_path
+
+
+@pytest.fixture
+def deep_thread_result() -> ScrapeResult:
+    """Create a result whose reply chain is deeper than the recursion limit."""
+    depth = sys.getrecursionlimit() + 100
+    comment = Comment(id=f"c{depth - 1}", author=Author(name="A"), content="x")
+    for i in range(depth - 2, -1, -1):
+        comment = Comment(
+            id=f"c{i}", author=Author(name="A"), content="x", replies=[comment]
+        )
+    return ScrapeResult(
+        group=GroupInfo(id="1", name="Deep", url="https://fb.com/groups/1"),
+        scraped_at=datetime(2024, 1, 15, 12, 0, 0),
+        date_range=DateRange(since="2024-01-01", until="2024-01-15"),
+        posts=[Post(id="p", author=Author(name="A"), content="x", comments=[comment])],
+    )
+
+
+def _connect_readonly(db_path: Path) -> sqlite3.Connection:
+    """Open an exported database read-only, for asserting on its contents."""
+    return sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True)
+
+
+def _read_csv(path: Path) -> tuple[dict[str, int], list[list[str]]]:
+    """Read a CSV file as (column index by header name, data rows)."""
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        return {name: i for i, name in enumerate(header)}, list(reader)
+
+
 class TestExportToSqlite:
     """Tests for export_to_sqlite function."""
 
-    def test_creates_database(
-        self, tmp_path: Path, sample_result: ScrapeResult
-    ) -> None:
+    def test_creates_database(self, exported_db: Path) -> None:
         """Test that export creates the database file."""
-        db_path = tmp_path / "test.db"
-        export_to_sqlite(sample_result, db_path)
-
-        assert db_path.exists()
+        assert exported_db.exists()
 
-    def test_creates_tables(self, tmp_path: Path, sample_result: ScrapeResult) -> None:
+    def test_creates_tables(self, exported_db: Path) -> None:
         """Test that export creates all required tables."""
-        db_path = tmp_path / "test.db"
-        export_to_sqlite(sample_result, db_path)
-
-        conn = sqlite3.connect(db_path)
+        conn = _connect_readonly(exported_db)
         cursor = conn.cursor()
 
         # Check tables exist
@@ -109,12 +149,9 @@ class TestExportToSqlite:
 
         conn.close()
 
-    def test_exports_group(self, tmp_path: Path, sample_result: ScrapeResult) -> None:
+    def test_exports_group(self, exported_db: Path) -> None:
         """Test that group data is exported correctly."""
-        db_path = tmp_path / "test.db"
-        export_to_sqlite(sample_result, db_path)
-
-        conn = sqlite3.connect(db_path)
+        conn = _connect_readonly(exported_db)
         cursor = conn.cursor()
 
         cursor.execute("SELECT id, name, url FROM groups")
@@ -126,12 +163,9 @@ class TestExportToSqlite:
 
         conn.close()
 
-    def test_exports_posts(self, tmp_path: Path, sample_result: ScrapeResult) -> None:
+    def test_exports_posts(self, exported_db: Path) -> None:
         """Test that posts are exported correctly."""
-        db_path = tmp_path / "test.db"
-        export_to_sqlite(sample_result, db_path)
-
-        conn = sqlite3.connect(db_path)
+        conn = _connect_readonly(exported_db)
         cursor = conn.cursor()
 
         cursor.execute("SELECT id, content, reactions_total FROM posts ORDER BY id")
@@ -146,14 +180,37 @@ class TestExportToSqlite:
 
         conn.close()
 
-    def test_exports_comments(
-        self, tmp_path: Path, sample_result: ScrapeResult
-    ) -> None:
-        """Test that comments are exported correctly."""
-        db_path = tmp_path / "test.db"
-        export_to_sqlite(sample_result, db_path)
+    def test_column_tuples_match_tables(self, exported_db: Path) -> None:
+        """Test the column tuples list the tables' columns in order, with types."""
+        conn = _connect_readonly(exported_db)
+        cursor = conn.cursor()
+
+        for table, columns in (
+            ("posts", _POST_COLUMNS),
+            ("comments", _COMMENT_COLUMNS),
+        ):
+            cursor.execute(f"SELECT name, type FROM pragma_table_info('{table}')")
+            assert tuple(cursor.fetchall()) == columns
 
-        conn = sqlite3.connect(db_path)
+        conn.close()
+
+    def test_exports_reaction_breakdown(self, exported_db: Path) -> None:
+        """Test that each reaction type lands in its own column."""
+        conn = _connect_readonly(exported_db)
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "SELECT reactions_total, reactions_like, reactions_love, reactions_haha,"
+            " reactions_wow, reactions_sad, reactions_angry"
+            " FROM posts WHERE id = 'post_1'"
+        )
+        assert cursor.fetchone() == (42, 30, 10, 2, 0, 0, 0)
+
+        conn.close()
+
+    def test_exports_comments(self, exported_db: Path) -> None:
+        """Test that comments are exported correctly."""
+        conn = _connect_readonly(exported_db)
         cursor = conn.cursor()
 
         cursor.execute("SELECT id, content, post_id FROM comments ORDER BY id")
@@ -167,14 +224,9 @@ class TestExportToSqlite:
 
         conn.close()
 
-    def test_exports_nested_replies(
-        self, tmp_path: Path, sample_result: ScrapeResult
-    ) -> None:
+    def test_exports_nested_replies(self, exported_db: Path) -> None:
         """Test that nested replies have correct parent_comment_id."""
-        db_path = tmp_path / "test.db"
-        export_to_sqlite(sample_result, db_path)
-
-        conn = sqlite3.connect(db_path)
+        conn = _connect_readonly(exported_db)
         cursor = conn.cursor()
 
         cursor.execute(
@@ -200,7 +252,7 @@ class TestExportToSqlite:
         sample_result.group.name = "Updated Group Name"
         export_to_sqlite(sample_result, db_path)
 
-        conn = sqlite3.connect(db_path)
+        conn = _connect_readonly(db_path)
         cursor = conn.cursor()
 
         cursor.execute("SELECT COUNT(*) FROM groups")
@@ -211,6 +263,88 @@ class TestExportToSqlite:
 
         conn.close()
 
+    def test_duplicate_ids_in_fresh_export(
+        self, tmp_path: Path, sample_result: ScrapeResult
+    ) -> None:
+        """Test that repeated ids within one export keep the last row."""
+        db_path = tmp_path / "test.db"
+        post = sample_result.posts[0]
+        post.comments[1].id = post.comments[0].id
+
+        export_to_sqlite(sample_result, db_path)
+
+        conn = _connect_readonly(db_path)
+        cursor = conn.cursor()
+        cursor.execute("SELECT content FROM comments WHERE id = 'comment_1'")
+        assert cursor.fetchall() == [("Agreed!",)]
+        conn.close()
+
+    def test_deep_reply_chain(
+        self, tmp_path: Path, deep_thread_result: ScrapeResult
+    ) -> None:
+        """Test that reply chains deeper than the recursion limit export."""
+        db_path = tmp_path / "test.db"
+        export_to_sqlite(deep_thread_result, db_path)
+
+        conn = _connect_readonly(db_path)
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT COUNT(*) FROM comments")
+        assert cursor.fetchone()[0] == sys.getrecursionlimit() + 100
+        cursor.execute("SELECT parent_comment_id FROM comments WHERE id = 'c1'")
+        assert cursor.fetchone()[0] == "c0"
+
+        conn.close()
+
+    def test_failed_export_rolls_back(
+        self,
+        tmp_path: Path,
+        sample_result: ScrapeResult,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a failure part-way through leaves no partial rows."""
+        db_path = tmp_path / "test.db"
+        monkeypatch.setattr("forage.exporter._INSERT_COMMENT_SQL", "INSERT INTO nope")
+
+        with pytest.raises(sqlite3.OperationalError):
+            export_to_sqlite(sample_result, db_path)
+
+        conn = _connect_readonly(db_path)
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT COUNT(*) FROM groups")
+        assert cursor.fetchone()[0] == 0
+        cursor.execute("SELECT COUNT(*) FROM posts")
+        assert cursor.fetchone()[0] == 0
+
+        conn.close()
+
+    def test_error_that_ends_transaction_is_not_masked(
+        self,
+        tmp_path: Path,
+        sample_result: ScrapeResult,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that an error SQLite already rolled back for is re-raised as is."""
+        db_path = tmp_path / "test.db"
+        post = sample_result.posts[0]
+        post.comments[1].id = post.comments[0].id
+        monkeypatch.setattr(
+            "forage.exporter._INSERT_COMMENT_SQL",
+            _INSERT_COMMENT_SQL.replace("OR REPLACE", "OR ROLLBACK"),
+        )
+
+        with pytest.raises(sqlite3.IntegrityError):
+            export_to_sqlite(sample_result, db_path)
+
+        conn = _connect_readonly(db_path)
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT COUNT(*) FROM posts")
+        assert cursor.fetchone()[0] == 0
+
+        conn.close()
+
     def test_empty_result(self, tmp_path: Path) -> None:
         """Test exporting result with no posts."""
         db_path = tmp_path / "test.db"
@@ -225,7 +359,7 @@ class TestExportToSqlite:
 
         export_to_sqlite(result, db_path)
 
-        conn = sqlite3.connect(db_path)
+        conn = _connect_readonly(db_path)
         cursor = conn.cursor()
 
         cursor.execute("SELECT COUNT(*) FROM groups")
@@ -236,10 +370,30 @@ class TestExportToSqlite:
 
         conn.close()
 
+    def test_uses_wal_journal(self, exported_db: Path) -> None:
+        """Test that the exported database is left in WAL journal mode."""
+        conn = _connect_readonly(exported_db)
+        cursor = conn.cursor()
+
+        cursor.execute("PRAGMA journal_mode")
+        assert cursor.fetchone()[0] == "wal"
+
+        conn.close()
+
 
 class TestExportToCsv:
     """Tests for export_to_csv function."""
 
+    def test_rejects_unknown_engine(
+        self, tmp_path: Path, sample_result: ScrapeResult
+    ) -> None:
+        """Test that an unknown engine raises instead of falling back."""
+        csv_path = tmp_path / "posts.csv"
+        with pytest.raises(ValueError, match="polars"):
+            export_to_csv(sample_result, csv_path, engine="polars")  # type: ignore[arg-type]
+
+        assert not csv_path.exists()
+
     def test_creates_posts_file(
         self, tmp_path: Path, sample_result: ScrapeResult
     ) -> None:
@@ -266,16 +420,14 @@ class TestExportToCsv:
         csv_path = tmp_path / "posts.csv"
         export_to_csv(sample_result, csv_path)
 
-        with open(csv_path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        col, rows = _read_csv(csv_path)
 
         assert len(rows) == 2
-        assert rows[0]["post_id"] == "post_1"
-        assert rows[0]["author_name"] == "Jane Doe"
-        assert rows[0]["content"] == "Test post content"
-        assert rows[0]["reactions_total"] == "42"
-        assert rows[1]["post_id"] == "post_2"
+        assert rows[0][col["post_id"]] == "post_1"
+        assert rows[0][col["author_name"]] == "Jane Doe"
+        assert rows[0][col["content"]] == "Test post content"
+        assert rows[0][col["reactions_total"]] == "42"
+        assert rows[1][col["post_id"]] == "post_2"
 
     def test_comments_csv_content(
         self, tmp_path: Path, sample_result: ScrapeResult
@@ -284,13 +436,10 @@ class TestExportToCsv:
         csv_path = tmp_path / "posts.csv"
         export_to_csv(sample_result, csv_path)
 
-        comments_path = tmp_path / "posts.comments.csv"
-        with open(comments_path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        col, rows = _read_csv(tmp_path / "posts.comments.csv")
 
         assert len(rows) == 3  # 2 comments + 1 reply
-        comment_ids = {row["comment_id"] for row in rows}
+        comment_ids = {row[col["comment_id"]] for row in rows}
         assert "comment_1" in comment_ids
         assert "comment_2" in comment_ids
         assert "reply_1" in comment_ids
@@ -302,13 +451,38 @@ class TestExportToCsv:
         csv_path = tmp_path / "posts.csv"
         export_to_csv(sample_result, csv_path)
 
-        comments_path = tmp_path / "posts.comments.csv"
-        with open(comments_path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = {row["comment_id"]: row for row in reader}
+        col, rows = _read_csv(tmp_path / "posts.comments.csv")
+        parents = {
+            row[col["comment_id"]]: row[col["parent_comment_id"]] for row in rows
+        }
+
+        assert parents["reply_1"] == "comment_1"
+        assert parents["comment_1"] == ""
+
+    def test_replies_follow_their_parent(
+        self, tmp_path: Path, sample_result: ScrapeResult
+    ) -> None:
+        """Test that comments are written in thread order."""
+        csv_path = tmp_path / "posts.csv"
+        export_to_csv(sample_result, csv_path)
+
+        col, rows = _read_csv(tmp_path / "posts.comments.csv")
+        ids = [row[col["comment_id"]] for row in rows]
 
-        assert rows["reply_1"]["parent_comment_id"] == "comment_1"
-        assert rows["comment_1"]["parent_comment_id"] == ""
+        assert ids == ["comment_1", "reply_1", "comment_2"]
+
+    def test_deep_reply_chain(
+        self, tmp_path: Path, deep_thread_result: ScrapeResult
+    ) -> None:
+        """Test that reply chains deeper than the recursion limit export."""
+        csv_path = tmp_path / "posts.csv"
+        export_to_csv(deep_thread_result, csv_path)
+
+        col, rows = _read_csv(tmp_path / "posts.comments.csv")
+
+        assert len(rows) == sys.getrecursionlimit() + 100
+        # Thread order: each reply directly follows its parent
+        assert [row[col["comment_id"]] for row in rows[:3]] == ["c0", "c1", "c2"]
 
     def test_empty_result(self, tmp_path: Path) -> None:
         """Test exporting result with no posts."""
@@ -324,13 +498,138 @@ class TestExportToCsv:
 
         export_to_csv(result, csv_path)
 
-        with open(csv_path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        _, rows = _read_csv(csv_path)
 
         assert len(rows) == 0  # No data rows, just header
 
 
+class TestExportToCsvPyarrow:
+    """Tests for the optional pyarrow CSV engine."""
+
+    def test_matches_python_engine(
+        self, tmp_path: Path, sample_result: ScrapeResult
+    ) -> None:
+        """Test that both engines produce the same parsed rows."""
+        pytest.importorskip("pyarrow")
+        export_to_csv(sample_result, tmp_path / "py.csv")
+        export_to_csv(sample_result, tmp_path / "pa.csv", engine="pyarrow")
+
+        assert _read_csv(tmp_path / "pa.csv") == _read_csv(tmp_path / "py.csv")
+        assert _read_csv(tmp_path / "pa.comments.csv") == _read_csv(
+            tmp_path / "py.comments.csv"
+        )
+
+    def test_empty_result(self, tmp_path: Path) -> None:
+        """Test that an empty result still writes both headers."""
+        pytest.importorskip("pyarrow")
+        csv_path = tmp_path / "posts.csv"
+        result = ScrapeResult(
+            group=GroupInfo(
+                id="456", name="Empty Group", url="https://fb.com/groups/456"
+            ),
+            scraped_at=datetime.now(),
+            date_range=DateRange(since="2024-01-01", until="2024-01-07"),
+            posts=[],
+        )
+
+        export_to_csv(result, csv_path, engine="pyarrow")
+
+        col, rows = _read_csv(csv_path)
+        assert "post_id" in col
+        assert rows == []
+        col, rows = _read_csv(tmp_path / "posts.comments.csv")
+        assert "comment_id" in col
+        assert rows == []
+
+    def test_falls_back_without_pyarrow(
+        self,
+        tmp_path: Path,
+        sample_result: ScrapeResult,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the csv module is used when pyarrow is missing."""
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        csv_path = tmp_path / "posts.csv"
+        export_to_csv(sample_result, csv_path, engine="pyarrow")
+
+        # csv module output ends rows with CRLF, pyarrow's with LF
+        assert csv_path.read_bytes().endswith(b"\r\n")
+        col, rows = _read_csv(csv_path)
+        assert [row[col["post_id"]] for row in rows] == ["post_1", "post_2"]
+
+
+class TestToColumns:
+    """Tests for the row-to-column transpose used by the Arrow exports."""
+
+    def test_transposes_rows(self) -> None:
+        rows = iter([("a", 1), ("b", 2)])
+        assert _to_columns(("id", "n"), rows) == {"id": ["a", "b"], "n": [1, 2]}
+
+    def test_no_rows(self) -> None:
+        assert _to_columns(("id", "n"), iter([])) == {"id": [], "n": []}
+
+
+class TestExportToParquet:
+    """Tests for export_to_parquet function."""
+
+    def test_round_trip(self, tmp_path: Path, sample_result: ScrapeResult) -> None:
+        """Test that posts and comments read back with the SQLite columns."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "posts.parquet"
+        export_to_parquet(sample_result, path)
+
+        posts = pq.read_table(path).to_pylist()
+        assert [p["id"] for p in posts] == ["post_1", "post_2"]
+        assert posts[0]["reactions_like"] == 30
+        assert posts[0]["timestamp"] == "2024-01-10T10:00:00"
+        assert posts[1]["author_profile_url"] is None
+
+        comments = pq.read_table(tmp_path / "posts.comments.parquet").to_pylist()
+        assert [c["id"] for c in comments] == ["comment_1", "reply_1", "comment_2"]
+        assert comments[1]["parent_comment_id"] == "comment_1"
+
+    def test_uses_zstd(self, tmp_path: Path, sample_result: ScrapeResult) -> None:
+        """Test that column chunks are ZSTD-compressed."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "posts.parquet"
+        export_to_parquet(sample_result, path)
+
+        column = pq.ParquetFile(path).metadata.row_group(0).column(0)
+        assert column.compression == "ZSTD"
+
+    def test_empty_result_keeps_schema(self, tmp_path: Path) -> None:
+        """Test that an empty export still has typed columns."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        pa = pytest.importorskip("pyarrow")
+        path = tmp_path / "posts.parquet"
+        result = ScrapeResult(
+            group=GroupInfo(
+                id="456", name="Empty Group", url="https://fb.com/groups/456"
+            ),
+            scraped_at=datetime.now(),
+            date_range=DateRange(since="2024-01-01", until="2024-01-07"),
+            posts=[],
+        )
+
+        export_to_parquet(result, path)
+
+        table = pq.read_table(path)
+        assert table.num_rows == 0
+        assert table.schema.field("reactions_total").type == pa.int64()
+        assert table.schema.field("content").type == pa.string()
+
+    def test_requires_pyarrow(
+        self,
+        tmp_path: Path,
+        sample_result: ScrapeResult,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a missing pyarrow raises ImportError."""
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        with pytest.raises(ImportError):
+            export_to_parquet(sample_result, tmp_path / "posts.parquet")
+
+
 class TestDetectPainSignals:
     """Tests for _detect_pain_signals function."""
 
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import datetime, timedelta
+from pathlib import Path
 
 import pytest
+from playwright.sync_api import ElementHandle
 
-from forage.models import Comment, Reactions
+from forage.models import Author, Comment, Reactions
 from forage.parser import (
+    _is_short_timestamp,
     extract_post_id,
     filter_comments,
     parse_modern_comment,
@@ -62,6 +66,13 @@ class TestParseTimestamp:
         expected = datetime.now() - timedelta(days=1)
         assert result.date() == expected.date()
 
+    def test_explicit_now(self) -> None:
+        """Test relative times resolve against a caller-supplied now."""
+        now = datetime(2024, 3, 10, 12, 0)
+        assert parse_timestamp("2h", now) == datetime(2024, 3, 10, 10, 0)
+        assert parse_timestamp("just now", now) == now
+        assert parse_timestamp("1w", now) == datetime(2024, 3, 3, 12, 0)
+
     def test_empty_string(self) -> None:
         """Test empty string returns None."""
         assert parse_timestamp("") is None
@@ -157,6 +168,26 @@ class TestParseTimestampEdgeCases:
             assert result is not None
             assert isinstance(result, datetime)
 
+    def test_iso_format(self) -> None:
+        """Test ISO 8601 timestamps take the fast path."""
+        assert parse_timestamp("2024-01-15") == datetime(2024, 1, 15)
+        assert parse_timestamp("2024-01-15T14:30:00") == datetime(2024, 1, 15, 14, 30)
+
+    def test_iso_with_offset_is_naive(self) -> None:
+        """Test timezone-aware ISO timestamps are returned as naive local time."""
+        result = parse_timestamp("2024-01-15T14:30:00+00:00")
+        assert result is not None
+        assert result.tzinfo is None
+
+    def test_absolute_date_formats(self) -> None:
+        """Test each family of absolute date formats parses exactly."""
+        assert parse_timestamp("January 15, 2024") == datetime(2024, 1, 15)
+        assert parse_timestamp("Jan 15, 2024 at 2:30 PM") == datetime(
+            2024, 1, 15, 14, 30
+        )
+        assert parse_timestamp("15 January 2024") == datetime(2024, 1, 15)
+        assert parse_timestamp("01/15/24") == datetime(2024, 1, 15)
+
 
 class TestExtractPostIdEdgeCases:
     """Edge case tests for extract_post_id function."""
@@ -197,14 +228,24 @@ class TestParseReactionsEdgeCases:
         assert result.total == 52
 
 
+class TestIsShortTimestamp:
+    """Tests for the relative time token check."""
+
+    @pytest.mark.parametrize("text", ["6d", "12h", "3w", "45m", "100d"])
+    def test_tokens(self, text: str) -> None:
+        assert _is_short_timestamp(text)
+
+    @pytest.mark.parametrize("text", ["", "d", "6", "6y", "6 d", "-6d", "Good", "6dd"])
+    def test_non_tokens(self, text: str) -> None:
+        assert not _is_short_timestamp(text)
+
+
 class TestFilterComments:
     """Tests for filter_comments function."""
 
     @pytest.fixture
     def sample_comments(self) -> list[Comment]:
         """Create sample comments for testing."""
-        from forage.models import Author
-
         return [
             Comment(
                 id="1",
@@ -258,6 +299,26 @@ class TestFilterComments:
         result = filter_comments([])
         assert result == []
 
+    def test_filters_nested_replies(self) -> None:
+        """Test that filters apply at every reply depth."""
+
+        def make(comment_id: str, total: int, replies: list[Comment]) -> Comment:
+            return Comment(
+                id=comment_id,
+                author=Author(name=f"User {comment_id}"),
+                content="text",
+                reactions=Reactions(total=total),
+                replies=replies,
+            )
+
+        deep = [make("r2a", 1, []), make("r2b", 9, []), make("r2c", 9, [])]
+        replies = [make("r1a", 3, deep), make("r1b", 7, [])]
+        result = filter_comments([make("top", 5, replies)], top_n=2)
+
+        assert [c.id for c in result[0].replies] == ["r1b", "r1a"]
+        # Ties keep their original order
+        assert [c.id for c in result[0].replies[1].replies] == ["r2b", "r2c"]
+
 
 class TestSkipReactions:
     """Tests for skip_reactions behavior in modern parsers."""
@@ -276,6 +337,21 @@ class TestSkipReactions:
         assert post is not None
         assert post.reactions.total == 0
 
+    def test_parse_modern_post_reads_reaction_text_fallbacks(
+        self, simple_post_html: str, mock_page, make_mock_element
+    ) -> None:
+        html = simple_post_html.replace('aria-label="42 reactions"', "")
+        post = parse_modern_post(make_mock_element(html), mock_page)
+        assert post is not None
+        assert post.reactions.total == 42
+
+        html = html.replace(
+            "All reactions: 42", "<span>7</span><span>Ann and 6 others</span>"
+        )
+        post = parse_modern_post(make_mock_element(html), mock_page)
+        assert post is not None
+        assert post.reactions.total == 7
+
     def test_parse_modern_comment_parses_reactions_by_default(
         self, simple_comment_element
     ) -> None:
@@ -289,3 +365,112 @@ class TestSkipReactions:
         comment = parse_modern_comment(simple_comment_element, skip_reactions=True)
         assert comment is not None
         assert comment.reactions.total == 0
+
+
+class TestSkipNonContentPosts:
+    """Tests for dropping feed modules that are not posts."""
+
+    @pytest.mark.parametrize(
+        "header", ["People you may know", "Suggested for you", "Groups you might like"]
+    )
+    def test_suggestion_modules_are_skipped(
+        self, simple_post_html: str, mock_page, make_mock_element, header: str
+    ) -> None:
+        html = simple_post_html.replace("<div>", f"<div><span>{header}</span>", 1)
+        assert parse_modern_post(make_mock_element(html), mock_page) is None
+
+    def test_header_after_first_100_chars_is_kept(
+        self, simple_post_html: str, mock_page, make_mock_element
+    ) -> None:
+        html = simple_post_html.replace(
+            "Looking for recommendations!",
+            "Looking for recommendations! " + "x" * 100 + " Suggested for you",
+        )
+        assert parse_modern_post(make_mock_element(html), mock_page) is not None
+
+
+class TestFallbackIds:
+    """Tests for ids derived from content when no permalink is available."""
+
+    def test_post_id_is_stable_across_runs(
+        self, simple_post_html: str, mock_page, make_mock_element
+    ) -> None:
+        """Test the fallback post id is a content hash, not a salted hash()."""
+        html = simple_post_html.replace(
+            "https://www.facebook.com/groups/123/posts/456?story_fbid=456", "#"
+        )
+        post = parse_modern_post(make_mock_element(html), mock_page)
+        assert post is not None
+        # Pinned value: must not change between processes or releases,
+        # otherwise SQLite upserts stop matching earlier exports
+        assert post.id == "post_745c54d4389e0e91"
+
+    def test_comment_id_is_stable_across_runs(self, simple_comment_element) -> None:
+        """Test comment ids are a content hash, not a salted hash()."""
+        comment = parse_modern_comment(simple_comment_element)
+        assert comment is not None
+        assert comment.id == "comment_82fb62b9dfcc95c3"
+
+
+class TestModernParsersInBrowser:
+    """Tests that run the parser JS against a real DOM in headless Chromium."""
+
+    def test_parse_modern_post_simple(
+        self,
+        make_dom_element: Callable[[str], ElementHandle],
+        simple_post_html: str,
+        mock_page,
+    ) -> None:
+        post = parse_modern_post(make_dom_element(simple_post_html), mock_page)
+        assert post is not None
+        assert post.id == "456"
+        assert post.author.name == "Jane Doe"
+        assert post.author.profile_url == "https://www.facebook.com/jane.doe"
+        assert post.content.startswith("This is a test post about local restaurants")
+        assert post.timestamp is not None
+        assert post.reactions.total == 42
+        assert post.comments_count == 15
+
+    def test_parse_modern_post_realistic(
+        self,
+        make_dom_element: Callable[[str], ElementHandle],
+        fixtures_dir: Path,
+        mock_page,
+    ) -> None:
+        """Test the author comes from a <strong> nested inside the profile link."""
+        html = (fixtures_dir / "post_realistic.html").read_text()
+        post = parse_modern_post(make_dom_element(html), mock_page)
+        assert post is not None
+        assert post.id == "pfbid02KPxmNqYvCmR8wj7HqLnJKzf9pXt5yWgR2vB3mN4hZ6Kj8"
+        assert post.author.name == "Jennifer Martinez"
+        assert (
+            post.author.profile_url == "https://www.facebook.com/jennifer.martinez.8675"
+        )
+        assert post.content.startswith("Has anyone tried the new Italian place")
+        assert post.reactions.total == 127
+
+    def test_parse_modern_comment_simple(
+        self,
+        make_dom_element: Callable[[str], ElementHandle],
+        simple_comment_html: str,
+    ) -> None:
+        comment = parse_modern_comment(make_dom_element(simple_comment_html))
+        assert comment is not None
+        # Same id as the mock-based TestFallbackIds test
+        assert comment.id == "comment_82fb62b9dfcc95c3"
+        assert comment.author.name == "Bob Wilson"
+        assert comment.author.profile_url == "https://www.facebook.com/bob.wilson"
+        assert comment.content == "Great recommendation! I love that place."
+        assert comment.reactions.total == 5
+
+    def test_parse_modern_comment_with_replies(
+        self, make_dom_element: Callable[[str], ElementHandle], fixtures_dir: Path
+    ) -> None:
+        """Test the top-level comment wins over the replies nested inside it."""
+        html = (fixtures_dir / "comment_with_replies.html").read_text()
+        comment = parse_modern_comment(make_dom_element(html))
+        assert comment is not None
+        assert comment.author.name == "Alice Brown"
+        assert comment.author.profile_url == "https://www.facebook.com/alice.brown"
+        assert comment.content.startswith("I totally agree!")
+        assert comment.reactions.total == 23
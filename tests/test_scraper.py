@@ -87,6 +87,14 @@ class TestCalculateDateRange:
         assert until.month == 1
         assert until.day == 15
 
+    def test_explicit_range_accepts_iso_datetimes(self) -> None:
+        """Test since/until are parsed as ISO 8601, time part included."""
+        options = ScrapeOptions(since="2024-01-01", until="2024-01-15T18:30:00")
+        since, until = calculate_date_range(options)
+
+        assert since == datetime(2024, 1, 1)
+        assert until == datetime(2024, 1, 15, 18, 30)
+
     def test_explicit_range(self) -> None:
         """Test explicit since and until dates."""
         options = ScrapeOptions(since="2024-01-01", until="2024-01-15")
@@ -103,17 +111,16 @@ class TestRandomDelay:
 
     def test_returns_positive(self) -> None:
         """Test random_delay returns positive value."""
-        for _ in range(100):
-            delay = random_delay(1.0, 0.5)
-            assert delay > 0
+        delays = [random_delay(1.0, 0.5) for _ in range(100)]
+        assert min(delays) > 0
 
     def test_within_bounds(self) -> None:
         """Test delay is within expected bounds."""
         base = 2.0
         variance = 0.5
-        for _ in range(100):
-            delay = random_delay(base, variance)
-            assert base - variance <= delay <= base + variance
+        delays = [random_delay(base, variance) for _ in range(100)]
+        assert base - variance <= min(delays)
+        assert max(delays) <= base + variance
 
     def test_varies(self) -> None:
         """Test that delay varies (not constant)."""
@@ -167,6 +174,11 @@ class TestNormalizeGroupIdentifierEdgeCases:
         result = normalize_group_identifier(url)
         assert "mycityfoodies" in result
 
+    def test_url_fragment_and_case(self) -> None:
+        """Test fragments are dropped and the host is matched case-insensitively."""
+        url = "https://www.Facebook.com/groups/mycityfoodies#posts"
+        assert normalize_group_identifier(url) == "mycityfoodies"
+
     def test_very_long_slug(self) -> None:
         """Test very long group slug."""
         slug = "a" * 100